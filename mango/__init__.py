@@ -176,10 +176,12 @@ from .perpmarketoperations import PerpMarketOperations as PerpMarketOperations
 from .perpopenorders import PerpOpenOrders as PerpOpenOrders
 from .placedorder import PlacedOrder as PlacedOrder
 from .placedorder import PlacedOrdersContainer as PlacedOrdersContainer
+from .publickey import distinct_public_keys as distinct_public_keys
 from .publickey import encode_public_key_for_sorting as encode_public_key_for_sorting
 from .reconnectingwebsocket import ReconnectingWebsocket as ReconnectingWebsocket
 from .retrier import RetryWithPauses as RetryWithPauses
 from .retrier import retry_context as retry_context
+from .serumeventqueue import OpenOrdersToCrankCache as OpenOrdersToCrankCache
 from .serumeventqueue import SerumEventQueue as SerumEventQueue
 from .serumeventqueue import UnseenSerumEventChangesTracker as UnseenSerumEventChangesTracker
 from .serummarket import SerumMarket as SerumMarket
@@ -15,7 +15,9 @@
 
 import typing
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
+from functools import cached_property, partial
 from solana.publickey import PublicKey
 from solana.rpc.types import MemcmpOpts
 
@@ -33,17 +35,37 @@ from .orders import Side
 from .perpaccount import PerpAccount
 from .perpopenorders import PerpOpenOrders
 from .placedorder import PlacedOrder
+from .text import indent_item_by
 from .token import Instrument, Token
 from .tokenbank import TokenBank
 from .version import Version
 
 
+# The layout sizes are fixed, so there's no need to walk the layout tree every time an account is parsed.
+_MANGO_ACCOUNT_SIZE: int = layouts.MANGO_ACCOUNT.sizeof()
+# mango_group is just after the METADATA, which is the first entry.
+_METADATA_SIZE: int = layouts.METADATA.sizeof()
+# owner is just after mango_group in the layout, and it's a PublicKey which is 32 bytes.
+_OWNER_OFFSET: int = _METADATA_SIZE + 32
+
+# construct can compile a fixed layout down to straight-line Python code, which avoids the reflective
+# walk of the layout on every parse. It produces exactly the same `Container` as the uncompiled layout.
+_MANGO_ACCOUNT_PARSER: typing.Any = layouts.MANGO_ACCOUNT.compile()
+
+# Each owner's accounts are a separate `getProgramAccounts` call. Don't run more of those at once than this, no
+# matter how many owners are asked for.
+_MAXIMUM_CONCURRENT_OWNER_LOADS: int = 16
+
+
 # # 🥭 AccountSlot class
 #
 # `AccountSlot` gathers slot items together instead of separate arrays.
 #
+# Many callers only want balances, so the `PerpAccount` can be supplied as a `perp_account_loader` instead.
+# It's then only built the first time `perp_account` is read.
+#
 class AccountSlot:
-    def __init__(self, index: int, base_instrument: Instrument, base_token_bank: typing.Optional[TokenBank], quote_token_bank: TokenBank, raw_deposit: Decimal, deposit: InstrumentValue, raw_borrow: Decimal, borrow: InstrumentValue, spot_open_orders: typing.Optional[PublicKey], perp_account: typing.Optional[PerpAccount]) -> None:
+    def __init__(self, index: int, base_instrument: Instrument, base_token_bank: typing.Optional[TokenBank], quote_token_bank: TokenBank, raw_deposit: Decimal, deposit: InstrumentValue, raw_borrow: Decimal, borrow: InstrumentValue, spot_open_orders: typing.Optional[PublicKey], perp_account: typing.Optional[PerpAccount], perp_account_loader: typing.Optional[typing.Callable[[], PerpAccount]] = None) -> None:
         self.index: int = index
         self.base_instrument: Instrument = base_instrument
         self.base_token_bank: typing.Optional[TokenBank] = base_token_bank
@@ -53,7 +75,20 @@ class AccountSlot:
         self.raw_borrow: Decimal = raw_borrow
         self.borrow: InstrumentValue = borrow
         self.spot_open_orders: typing.Optional[PublicKey] = spot_open_orders
-        self.perp_account: typing.Optional[PerpAccount] = perp_account
+        self._perp_account: typing.Optional[PerpAccount] = perp_account
+        self._perp_account_loader: typing.Optional[typing.Callable[[], PerpAccount]] = perp_account_loader
+
+    @property
+    def perp_account(self) -> typing.Optional[PerpAccount]:
+        if self._perp_account_loader is not None:
+            self._perp_account = self._perp_account_loader()
+            self._perp_account_loader = None
+        return self._perp_account
+
+    @perp_account.setter
+    def perp_account(self, perp_account: typing.Optional[PerpAccount]) -> None:
+        self._perp_account = perp_account
+        self._perp_account_loader = None
 
     @property
     def net_value(self) -> InstrumentValue:
@@ -66,7 +101,7 @@ class AccountSlot:
     def __str__(self) -> str:
         perp_account: str = "None"
         if self.perp_account is not None:
-            perp_account = f"{self.perp_account}".replace("\n", "\n        ")
+            perp_account = indent_item_by(self.perp_account, 2)
         return f"""« AccountSlot {self.base_instrument.symbol}
     Net Value:     {self.net_value}
         Deposited: {self.deposit} (raw value: {self.raw_deposit})
@@ -76,14 +111,19 @@ class AccountSlot:
         {perp_account}
 »"""
 
+    # Formatting a full `AccountSlot` is expensive, so `repr()` (used by loggers, debuggers and containers)
+    # gives just a short summary. Use `str()` for the full details.
     def __repr__(self) -> str:
-        return f"{self}"
+        return f"« AccountSlot {self.base_instrument.symbol} »"
 
 
 # # 🥭 Account class
 #
 # `Account` holds information about the account for a particular user/wallet for a particualr `Group`.
 #
+# The slots (and the values derived from them) are calculated only once, on first access, since an `Account`
+# doesn't change once it's loaded. (Spot OpenOrders is the one exception, so they're not cached.)
+#
 class Account(AddressableAccount):
     def __init__(self, account_info: AccountInfo, version: Version,
                  meta_data: Metadata, group_name: str, group_address: PublicKey, owner: PublicKey,
@@ -115,45 +155,40 @@ class Account(AddressableAccount):
             raise Exception(f"Shared quote does not have a token: {self.shared_quote}")
         return Token.ensure(token_bank.token)
 
-    @property
+    @cached_property
     def slots(self) -> typing.Sequence[AccountSlot]:
-        return [*[slot for slot in self.base_slots], self.shared_quote]
+        return [*self.base_slots, self.shared_quote]
 
-    @property
+    @cached_property
     def slots_by_index(self) -> typing.Sequence[typing.Optional[AccountSlot]]:
-        mapped_items: typing.List[typing.Optional[AccountSlot]] = []
-        slot_counter = 0
-        for available in self.slot_indices:
-            if available:
-                mapped_items += [self.base_slots[slot_counter]]
-                slot_counter += 1
-            else:
-                mapped_items += [None]
-        mapped_items += [self.shared_quote]
+        base_slots: typing.Iterator[AccountSlot] = iter(self.base_slots)
+        mapped_items: typing.List[typing.Optional[AccountSlot]] = [
+            next(base_slots) if available else None for available in self.slot_indices]
+        mapped_items.append(self.shared_quote)
 
         return mapped_items
 
-    @property
+    @cached_property
     def deposits(self) -> typing.Sequence[InstrumentValue]:
         return [slot.deposit for slot in self.slots]
 
-    @property
+    @cached_property
     def deposits_by_index(self) -> typing.Sequence[typing.Optional[InstrumentValue]]:
         return [slot.deposit if slot is not None else None for slot in self.slots_by_index]
 
-    @property
+    @cached_property
     def borrows(self) -> typing.Sequence[InstrumentValue]:
         return [slot.borrow for slot in self.slots]
 
-    @property
+    @cached_property
     def borrows_by_index(self) -> typing.Sequence[typing.Optional[InstrumentValue]]:
         return [slot.borrow if slot is not None else None for slot in self.slots_by_index]
 
-    @property
+    @cached_property
     def net_values(self) -> typing.Sequence[InstrumentValue]:
         return [slot.net_value for slot in self.slots]
 
-    @property
+    @cached_property
     def net_values_by_index(self) -> typing.Sequence[typing.Optional[InstrumentValue]]:
         return [slot.net_value if slot is not None else None for slot in self.slots_by_index]
 
@@ -179,24 +214,21 @@ class Account(AddressableAccount):
         owner: PublicKey = layout.owner
         info: str = layout.info
         mngo_token = group.liquidity_incentive_token
-        in_margin_basket: typing.Sequence[bool] = list([bool(in_basket) for in_basket in layout.in_margin_basket])
+        in_margin_basket: typing.Sequence[bool] = [in_basket != 0 for in_basket in layout.in_margin_basket]
         active_in_basket: typing.List[bool] = []
         slots: typing.List[AccountSlot] = []
-        placed_orders_all_markets: typing.List[typing.List[PlacedOrder]] = [[]
-                                                                            for _ in range(len(group.slot_indices) - 1)]
-        for index, order_market in enumerate(layout.order_market):
+        # Only markets that actually have orders get a list of placed orders.
+        placed_orders_all_markets: typing.Dict[int, typing.List[PlacedOrder]] = {}
+        for order_market, order_side, id, client_id in zip(layout.order_market, layout.order_side, layout.order_ids, layout.client_order_ids):
             if order_market != 0xFF:
-                side = Side.from_value(layout.order_side[index])
-                id = layout.order_ids[index]
-                client_id = layout.client_order_ids[index]
+                side = Side.from_value(order_side)
                 placed_order = PlacedOrder(id, client_id, side)
-                placed_orders_all_markets[int(order_market)] += [placed_order]
+                placed_orders_all_markets.setdefault(int(order_market), []).append(placed_order)
 
         quote_token_bank: TokenBank = group.shared_quote
         quote_token: Token = group.shared_quote_token
 
-        for index in range(len(group.slots_by_index)):
-            group_slot = group.slots_by_index[index]
+        for index, group_slot in enumerate(group.slots_by_index):
             if group_slot is not None:
                 instrument = group_slot.base_instrument
                 token_bank = group_slot.base_token_bank
@@ -217,9 +249,10 @@ class Account(AddressableAccount):
                 deposit = InstrumentValue(instrument, instrument.shift_to_decimals(intrinsic_deposit))
                 borrow = InstrumentValue(instrument, instrument.shift_to_decimals(intrinsic_borrow))
 
-                perp_open_orders = PerpOpenOrders(placed_orders_all_markets[index])
+                perp_open_orders = PerpOpenOrders(placed_orders_all_markets.get(index, []))
 
-                perp_account = PerpAccount.from_layout(
+                perp_account_loader: typing.Callable[[], PerpAccount] = partial(
+                    PerpAccount.from_layout,
                     layout.perp_accounts[index],
                     instrument,
                     quote_token,
@@ -229,12 +262,12 @@ class Account(AddressableAccount):
                 spot_open_orders = layout.spot_open_orders[index]
                 account_slot: AccountSlot = AccountSlot(index, instrument, token_bank, quote_token_bank,
                                                         raw_deposit, deposit, raw_borrow, borrow,
-                                                        spot_open_orders, perp_account)
+                                                        spot_open_orders, None, perp_account_loader)
 
-                slots += [account_slot]
-                active_in_basket += [True]
+                slots.append(account_slot)
+                active_in_basket.append(True)
             else:
-                active_in_basket += [False]
+                active_in_basket.append(False)
 
         quote_index: int = len(layout.deposits) - 1
         raw_quote_deposit: Decimal = layout.deposits[quote_index]
@@ -255,16 +288,17 @@ class Account(AddressableAccount):
         being_liquidated: bool = bool(layout.being_liquidated)
         is_bankrupt: bool = bool(layout.is_bankrupt)
 
-        return Account(account_info, version, meta_data, group.name, group.address, owner, info, quote, in_margin_basket, active_in_basket, slots, msrm_amount, being_liquidated, is_bankrupt)
+        # The parsed sequences never change, so freeze them as tuples.
+        return Account(account_info, version, meta_data, group.name, group.address, owner, info, quote, tuple(in_margin_basket), tuple(active_in_basket), tuple(slots), msrm_amount, being_liquidated, is_bankrupt)
 
     @staticmethod
     def parse(account_info: AccountInfo, group: Group, cache: Cache) -> "Account":
         data = account_info.data
-        if len(data) != layouts.MANGO_ACCOUNT.sizeof():
+        if len(data) != _MANGO_ACCOUNT_SIZE:
             raise Exception(
-                f"Account data length ({len(data)}) does not match expected size ({layouts.MANGO_ACCOUNT.sizeof()})")
+                f"Account data length ({len(data)}) does not match expected size ({_MANGO_ACCOUNT_SIZE})")
 
-        layout = layouts.MANGO_ACCOUNT.parse(data)
+        layout = _MANGO_ACCOUNT_PARSER.parse(data)
         return Account.from_layout(layout, account_info, Version.V3, group, cache)
 
     @staticmethod
@@ -277,53 +311,67 @@ class Account(AddressableAccount):
 
     @staticmethod
     def load_all(context: Context, group: Group) -> typing.Sequence["Account"]:
-        # mango_group is just after the METADATA, which is the first entry.
-        group_offset = layouts.METADATA.sizeof()
-        # owner is just after mango_group in the layout, and it's a PublicKey which is 32 bytes.
         filters = [
             MemcmpOpts(
-                offset=group_offset,
+                offset=_METADATA_SIZE,
                 bytes=encode_key(group.address)
             )
         ]
 
-        results = context.client.get_program_accounts(
-            context.mango_program_address, memcmp_opts=filters, data_size=layouts.MANGO_ACCOUNT.sizeof())
-        cache: Cache = group.fetch_cache(context)
-        accounts: typing.List[Account] = []
-        for account_data in results:
-            address = PublicKey(account_data["pubkey"])
-            account_info = AccountInfo._from_response_values(account_data["account"], address)
-            account = Account.parse(account_info, group, cache)
-            accounts += [account]
-        return accounts
+        return Account._load_all_matching(context, group, filters)
 
     @staticmethod
     def load_all_for_owner(context: Context, owner: PublicKey, group: Group) -> typing.Sequence["Account"]:
-        # mango_group is just after the METADATA, which is the first entry.
-        group_offset = layouts.METADATA.sizeof()
-        # owner is just after mango_group in the layout, and it's a PublicKey which is 32 bytes.
-        owner_offset = group_offset + 32
         filters = [
             MemcmpOpts(
-                offset=group_offset,
+                offset=_METADATA_SIZE,
                 bytes=encode_key(group.address)
             ),
             MemcmpOpts(
-                offset=owner_offset,
+                offset=_OWNER_OFFSET,
                 bytes=encode_key(owner)
             )
         ]
 
-        results = context.client.get_program_accounts(
-            context.mango_program_address, memcmp_opts=filters, data_size=layouts.MANGO_ACCOUNT.sizeof())
-        cache: Cache = group.fetch_cache(context)
+        return Account._load_all_matching(context, group, filters)
+
+    # Bots that manage several groups (or several owners) would otherwise pay for each lookup one after the
+    # other. Each lookup is independent network I/O, so they're run concurrently (up to
+    # `_MAXIMUM_CONCURRENT_OWNER_LOADS` at a time) and the results are returned in the same order as
+    # `owners_and_groups`.
+    #
+    # They aren't sent as one JSON-RPC batch: `getProgramAccounts` is one of the heaviest RPC calls, and a
+    # batch of them comes back as a single response that's only usable once every lookup has finished, under
+    # one request timeout.
+    @staticmethod
+    def load_all_for_owners(context: Context, owners_and_groups: typing.Sequence[typing.Tuple[PublicKey, Group]]) -> typing.Sequence[typing.Sequence["Account"]]:
+        if len(owners_and_groups) == 0:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(len(owners_and_groups), _MAXIMUM_CONCURRENT_OWNER_LOADS)) as executor:
+            futures: typing.List[Future[typing.Sequence[Account]]] = [
+                executor.submit(Account.load_all_for_owner, context, owner, group) for owner, group in owners_and_groups]
+            return [future.result() for future in futures]
+
+    # Fetching the program accounts and fetching the group's `Cache` are independent RPC calls, so the
+    # `Cache` is fetched on a worker thread while the accounts are being fetched. Parsing itself is pure
+    # Python and holds the GIL, so that's done serially once both are available.
+    #
+    # Mango accounts are large and mostly zeroes, so they're requested compressed as 'base64+zstd'.
+    @staticmethod
+    def _load_all_matching(context: Context, group: Group, filters: typing.List[MemcmpOpts]) -> typing.Sequence["Account"]:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            cache_future: Future[Cache] = executor.submit(group.fetch_cache, context)
+            results = context.client.get_program_accounts(
+                context.mango_program_address, encoding="base64+zstd", memcmp_opts=filters, data_size=_MANGO_ACCOUNT_SIZE)
+            cache: Cache = cache_future.result()
+
         accounts: typing.List[Account] = []
         for account_data in results:
             address = PublicKey(account_data["pubkey"])
             account_info = AccountInfo._from_response_values(account_data["account"], address)
             account = Account.parse(account_info, group, cache)
-            accounts += [account]
+            accounts.append(account)
         return accounts
 
     @staticmethod
@@ -372,9 +420,9 @@ class Account(AddressableAccount):
 
     def __str__(self) -> str:
         info = f"'{self.info}'" if self.info else "(un-named)"
-        shared_quote: str = f"{self.shared_quote}".replace("\n", "\n        ")
+        shared_quote: str = indent_item_by(self.shared_quote, 2)
         slot_count = len(self.base_slots)
-        slots = "\n        ".join([f"{item}".replace("\n", "\n        ") for item in self.base_slots])
+        slots = "\n        ".join(indent_item_by(item, 2) for item in self.base_slots)
 
         symbols: typing.Sequence[str] = [slot.base_instrument.symbol for slot in self.base_slots]
         in_margin_basket = ", ".join(symbols) or "None"
@@ -392,5 +440,7 @@ class Account(AddressableAccount):
         {slots}
 »"""
 
+    # Formatting a full `Account` is expensive, so `repr()` (used by loggers, debuggers and containers) gives
+    # just a short summary. Use `str()` for the full details.
     def __repr__(self) -> str:
-        return f"{self}"
+        return f"« Account [{self.address}] »"
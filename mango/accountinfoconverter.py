@@ -37,51 +37,83 @@ from .token import Instrument, Token
 from .tokenbank import NodeBank, RootBank, TokenBank
 
 
+# Both Mango accounts and perp markets store their group address straight after the METADATA. Reading
+# just those 32 bytes avoids parsing the whole account only to find out which group it belongs to.
+_GROUP_ADDRESS_OFFSET: int = layouts.METADATA.sizeof()
+
+
+def _group_address_from_data(data: bytes) -> PublicKey:
+    return PublicKey(data[_GROUP_ADDRESS_OFFSET:_GROUP_ADDRESS_OFFSET + 32])
+
+
+# `PublicKey` isn't hashable, so groups are cached by the bytes of their address. Each converter gets its
+# own cache, so converters that need a `Group` only load each `Group` once, no matter how many
+# `AccountInfo`s they convert.
+def _build_group_loader(context: Context) -> typing.Callable[[PublicKey], Group]:
+    groups: typing.Dict[bytes, Group] = {}
+
+    def load_group(group_address: PublicKey) -> Group:
+        group_key: bytes = bytes(group_address)
+        if group_key not in groups:
+            groups[group_key] = Group.load(context, group_address)
+        return groups[group_key]
+
+    return load_group
+
+
+def _build_account_converter(context: Context) -> typing.Callable[[AccountInfo], AddressableAccount]:
+    load_group = _build_group_loader(context)
+
+    def account_loader(account_info: AccountInfo) -> Account:
+        group_address = _group_address_from_data(account_info.data)
+        group: Group = load_group(group_address)
+        cache: Cache = group.fetch_cache(context)
+        return Account.parse(account_info, group, cache)
+    return account_loader
+
+
+def _build_perp_market_details_converter(context: Context) -> typing.Callable[[AccountInfo], AddressableAccount]:
+    load_group = _build_group_loader(context)
+
+    def perp_market_details_loader(account_info: AccountInfo) -> PerpMarketDetails:
+        group_address = _group_address_from_data(account_info.data)
+        group: Group = load_group(group_address)
+        return PerpMarketDetails.parse(account_info, group)
+    return perp_market_details_loader
+
+
+class _FakePerpMarketDetails(PerpMarketDetails):
+    def __init__(self) -> None:
+        self.base_instrument = Instrument("UNKNOWNBASE", "Unknown Base", Decimal(0))
+        self.quote_token = TokenBank(Token("UNKNOWNQUOTE", "Unknown Quote",
+                                     Decimal(0), PublicKey(0)), PublicKey(0))
+        self.base_lot_size = Decimal(1)
+        self.quote_lot_size = Decimal(1)
+
+
+# Maps the (upper-case) account type to a function that builds the converter for a given `Context`.
+_CONVERTER_BUILDERS: typing.Dict[str, typing.Callable[[Context], typing.Callable[[AccountInfo], AddressableAccount]]] = {
+    "GROUP": lambda context: lambda account_info: Group.parse_with_context(context, account_info),
+    "ACCOUNT": _build_account_converter,
+    "OPENORDERS": lambda _: lambda account_info: OpenOrders.parse(account_info, Decimal(6), Decimal(6)),
+    "PERPEVENTQUEUE": lambda _: lambda account_info: PerpEventQueue.parse(account_info, NullLotSizeConverter()),
+    "SERUMEVENTQUEUE": lambda _: SerumEventQueue.parse,
+    "CACHE": lambda _: Cache.parse,
+    "ROOTBANK": lambda _: RootBank.parse,
+    "NODEBANK": lambda _: NodeBank.parse,
+    "PERPMARKETDETAILS": _build_perp_market_details_converter,
+    "PERPORDERBOOKSIDE": lambda _: lambda account_info: PerpOrderBookSide.parse(account_info, _FakePerpMarketDetails()),
+}
+
+
 # # 🥭 build_account_info_converter function
 #
 # Given a `Context` and an account type, returns a function that can take an `AccountInfo` and
 # return one of our objects.
 #
 def build_account_info_converter(context: Context, account_type: str) -> typing.Callable[[AccountInfo], AddressableAccount]:
-    account_type_upper = account_type.upper()
-    if account_type_upper == "GROUP":
-        return lambda account_info: Group.parse_with_context(context, account_info)
-    elif account_type_upper == "ACCOUNT":
-        def account_loader(account_info: AccountInfo) -> Account:
-            layout_account = layouts.MANGO_ACCOUNT.parse(account_info.data)
-            group_address = layout_account.group
-            group: Group = Group.load(context, group_address)
-            cache: Cache = group.fetch_cache(context)
-            return Account.parse(account_info, group, cache)
-        return account_loader
-    elif account_type_upper == "OPENORDERS":
-        return lambda account_info: OpenOrders.parse(account_info, Decimal(6), Decimal(6))
-    elif account_type_upper == "PERPEVENTQUEUE":
-        return lambda account_info: PerpEventQueue.parse(account_info, NullLotSizeConverter())
-    elif account_type_upper == "SERUMEVENTQUEUE":
-        return lambda account_info: SerumEventQueue.parse(account_info)
-    elif account_type_upper == "CACHE":
-        return lambda account_info: Cache.parse(account_info)
-    elif account_type_upper == "ROOTBANK":
-        return lambda account_info: RootBank.parse(account_info)
-    elif account_type_upper == "NODEBANK":
-        return lambda account_info: NodeBank.parse(account_info)
-    elif account_type_upper == "PERPMARKETDETAILS":
-        def perp_market_details_loader(account_info: AccountInfo) -> PerpMarketDetails:
-            layout_perp_market_details = layouts.PERP_MARKET.parse(account_info.data)
-            group_address = layout_perp_market_details.group
-            group: Group = Group.load(context, group_address)
-            return PerpMarketDetails.parse(account_info, group)
-        return perp_market_details_loader
-    elif account_type_upper == "PERPORDERBOOKSIDE":
-        class __FakePerpMarketDetails(PerpMarketDetails):
-            def __init__(self) -> None:
-                self.base_instrument = Instrument("UNKNOWNBASE", "Unknown Base", Decimal(0))
-                self.quote_token = TokenBank(Token("UNKNOWNQUOTE", "Unknown Quote",
-                                             Decimal(0), PublicKey(0)), PublicKey(0))
-                self.base_lot_size = Decimal(1)
-                self.quote_lot_size = Decimal(1)
-
-        return lambda account_info: PerpOrderBookSide.parse(account_info, __FakePerpMarketDetails())
-
-    raise Exception(f"Could not find AccountInfo converter for type {account_type}.")
+    builder = _CONVERTER_BUILDERS.get(account_type.upper())
+    if builder is None:
+        raise Exception(f"Could not find AccountInfo converter for type {account_type}.")
+
+    return builder(context)
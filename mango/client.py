@@ -14,15 +14,23 @@
 #   [Email](mailto:hello@blockworks.foundation)
 
 import datetime
+import email.utils
+import itertools
 import json
 import logging
+import random
 import requests
+import requests.adapters
+import threading
 import time
 import typing
+import weakref
 
 
 from base64 import b64decode, b64encode
+from collections import OrderedDict, deque
 from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from decimal import Decimal
 from solana.blockhash import Blockhash, BlockhashCache
 from solana.keypair import Keypair
@@ -31,9 +39,10 @@ from solana.rpc.api import Client
 from solana.rpc.commitment import Commitment, Processed, Finalized
 from solana.rpc.providers.http import HTTPProvider
 from solana.rpc.types import DataSliceOpts, MemcmpOpts, RPCMethod, RPCResponse, TokenAccountOpts, TxOpts
-from solana.transaction import Transaction
+from solana.transaction import Transaction, TransactionInstruction
 
 from .constants import SOL_DECIMAL_DIVISOR
+from .encoding import encode_key
 from .instructionreporter import InstructionReporter
 from .logmessages import expand_log_messages
 from .text import indent_collection_as_str
@@ -41,6 +50,100 @@ from .text import indent_collection_as_str
 
 _STUB_TRANSACTION_SIGNATURE: str = "stub-for-already-submitted-transaction-signature"
 
+# Some RPC providers reject (or badly mishandle) very large JSON-RPC batches, so batches are split into
+# chunks of at most this many calls.
+_DEFAULT_MAX_BATCH_SIZE: int = 100
+
+# If no blockhash cache duration is configured, `send_transaction()` still reuses a recent blockhash instead of
+# fetching a fresh one for every single transaction. Once the blockhash is older than the TTL a fresh one is
+# fetched in the background, while the cached one keeps being used for up to the maximum age. (Both are well
+# within the ~60-90 seconds a blockhash stays valid.) Only a blockhash older than that is fetched while the
+# transaction waits.
+#
+# A configured duration overrides this: 0 fetches a fresh blockhash for every transaction, and anything
+# higher uses solana-py's `BlockhashCache` with that duration.
+_RECENT_BLOCKHASH_TTL_SECONDS: float = 2.0
+_RECENT_BLOCKHASH_MAXIMUM_AGE_SECONDS: float = 30.0
+
+# Rent-exempt minimums only change if the rent sysvar changes, which is very rare, so they're cached for
+# this long.
+_RENT_EXEMPTION_TTL_SECONDS: float = 600.0
+
+# Waiting for transaction confirmations starts with short pauses between checks (transactions often confirm
+# in well under a second) and backs off exponentially, with some jitter, to this maximum pause.
+_CONFIRMATION_INITIAL_PAUSE_SECONDS: float = 0.4
+_CONFIRMATION_MAXIMUM_PAUSE_SECONDS: float = 5.0
+
+# RPC nodes accept up to this many signatures in a single `getSignatureStatuses` call.
+_MAXIMUM_SIGNATURE_STATUSES_PER_CALL: int = 256
+
+# After this many rate-limit responses in a row, an `RPCCaller` stops sending requests to its node for a
+# while (rejecting them straight away instead) to give the node time to recover. Each further rate-limit
+# response moves on to the next, longer, pause. Pauses are jittered so callers sharing a node don't all
+# come back at the same moment. If the node says how long to wait (with a `Retry-After` header), that's
+# respected straight away.
+_RATE_LIMIT_BREAKER_THRESHOLD: int = 2
+_RATE_LIMIT_BREAKER_PAUSES_SECONDS: typing.Sequence[float] = [1, 2, 4, 8, 16, 30]
+
+# How long the result of an RPC node health check is reused before checking again.
+_HEALTH_CHECK_TTL_SECONDS: float = 2.0
+
+# The most requests `BetterClient` will have in flight at once when it fans calls out. It's kept below the
+# `RPCCaller`'s connection pool size so every request gets a pooled connection.
+_MAXIMUM_CONCURRENT_REQUESTS: int = 16
+
+# Connect and read timeouts for RPC requests. Without them, a node that accepts a connection but never
+# responds would hang its caller forever instead of letting it move on to the next provider. The read
+# timeout is generous because big `getProgramAccounts` calls can legitimately take a while.
+_REQUEST_TIMEOUT_SECONDS: typing.Tuple[float, float] = (5, 60)
+
+# Calls to `get_account_info_batched()` are collected for this long (or until this many are waiting) and then
+# all sent together in a single `getMultipleAccounts` call. 100 is the most accounts RPC nodes accept in one
+# `getMultipleAccounts` call.
+_ACCOUNT_BATCH_WINDOW_SECONDS: float = 0.005
+_ACCOUNT_BATCH_MAXIMUM_SIZE: int = 100
+
+# Responses to these methods don't change (or change very rarely) for the same parameters, so successful
+# responses are reused for this many seconds. `getRecentBlockhash` isn't here - a stale blockhash has to be
+# replaced immediately when a node says it's not found, and `send_transaction()` already reuses them briefly.
+# Neither is `getMinimumBalanceForRentExemption` - `BetterClient` caches rent-exempt minimums itself, and can
+# fall back to a stale one if every provider is rate-limiting.
+_CACHEABLE_METHOD_TTL_SECONDS: typing.Dict[str, float] = {
+    "getConfirmedTransaction": 86400,
+}
+_RESPONSE_CACHE_MAXIMUM_SIZE: int = 1024
+
+# Reads of these methods are hedged when there's more than one provider: if the current provider hasn't
+# responded after the hedge delay, the same request is also sent to the next provider and whichever
+# succeeds first is used. They're all small, safe-to-repeat reads - big calls like `getProgramAccounts`
+# aren't hedged because doubling them up costs the nodes too much, and writes are never hedged.
+_HEDGED_METHODS: typing.FrozenSet[str] = frozenset({
+    "getAccountInfo",
+    "getBalance",
+    "getConfirmedTransaction",
+    "getMinimumBalanceForRentExemption",
+    "getMultipleAccounts",
+    "getSignatureStatuses",
+    "getTokenAccountBalance",
+    "getTokenAccountsByOwner",
+})
+_HEDGE_AFTER_SECONDS: float = 0.15
+
+TResult = typing.TypeVar("TResult")
+
+
+# Every JSON-RPC request has the same headers and the same fixed fields, so the headers are shared and the
+# fixed part of the body is a template - only the method name and parameters need encoding per request.
+# (Method names are plain RPC identifiers so they need no escaping.)
+_JSON_HEADERS: typing.Dict[str, str] = {"Content-Type": "application/json"}
+_REQUEST_TEMPLATE: str = '{"jsonrpc": "2.0", "id": %d, "method": "%s", "params": %s}'
+
+
+# Params are always encoded as they're given - a tuple encodes as a JSON array just like a list, so
+# there's no need to copy them into a new list first.
+def _encode_request(request_id: int, method: RPCMethod, params: typing.Sequence[typing.Any]) -> str:
+    return _REQUEST_TEMPLATE % (request_id, method, json.dumps(params))
+
 
 # # 🥭 CompoundException class
 #
@@ -88,7 +191,9 @@ class ClientException(Exception):
 # independent of other error handling.
 #
 class RateLimitException(ClientException):
-    pass
+    def __init__(self, message: str, name: str, cluster_url: str, retry_after_seconds: typing.Optional[float] = None) -> None:
+        super().__init__(message, name, cluster_url)
+        self.retry_after_seconds: typing.Optional[float] = retry_after_seconds
 
 
 # # 🥭 TooMuchBandwidthRateLimitException class
@@ -223,20 +328,27 @@ class TransactionException(ClientException):
             response_details = f"""
     Response:
         {self.response_text}"""
+
+            # Each item is indented on its own and the results joined once, rather than joining everything
+            # and then re-scanning the whole (possibly huge) joined text to indent it.
+            def _indented_lines(items: typing.Iterable[typing.Any]) -> str:
+                return "\n        ".join((item if isinstance(item, str) else f"{item}").replace("\n", "\n        ")
+                                         for item in items)
+
             transaction_details = ""
             if self.transaction is not None:
-                instruction_details = "\n".join(
-                    list(map(self.instruction_reporter.report, self.transaction.instructions)))
-                transaction_details = "\n    Instructions:\n        " + instruction_details.replace("\n", "\n        ")
+                instruction_details = _indented_lines(self.instruction_reporter.report(instruction)
+                                                      for instruction in self.transaction.instructions)
+                transaction_details = "\n    Instructions:\n        " + instruction_details
             accounts = "No Accounts"
             if len(self.accounts) > 0:
-                accounts = "\n        ".join([f"{item}".replace("\n", "\n        ") for item in self.accounts])
+                accounts = _indented_lines(self.accounts)
             errors = "No Errors"
             if len(self.errors) > 0:
-                errors = "\n        ".join([f"{item}".replace("\n", "\n        ") for item in self.errors])
+                errors = _indented_lines(self.errors)
             logs = "No Logs"
             if len(self.logs) > 0:
-                logs = "\n        ".join([f"{item}".replace("\n", "\n        ") for item in self.logs])
+                logs = _indented_lines(self.logs)
             return f"""« TransactionException in '{self.name}' [{self.rpc_method}]: {self.code}:: {self.message}{transaction_details}
     Accounts:
         {accounts}
@@ -255,6 +367,9 @@ class TransactionException(ClientException):
 UnspecifiedCommitment = Commitment("unspecified")
 UnspecifiedEncoding = "unspecified"
 
+# Transactions sent without explicit options use the client's own commitment and preflight setting.
+_DEFAULT_TX_OPTS: TxOpts = TxOpts(preflight_commitment=UnspecifiedCommitment)
+
 
 # # 🥭 SlotHolder class
 #
@@ -285,12 +400,69 @@ class SlotHolder:
         return True
 
 
+# # 🥭 _TokenBucket class
+#
+# A `_TokenBucket` limits how fast requests are sent. It holds up to `burst` tokens and refills at
+# `rate_per_second` tokens per second. Each request takes a token, waiting for one if none are left.
+#
+class _TokenBucket:
+    def __init__(self, rate_per_second: float, burst: float) -> None:
+        self.rate_per_second: float = rate_per_second
+        self.burst: float = burst
+        self._lock: threading.Lock = threading.Lock()
+        self._tokens: float = burst
+        self._updated_at: float = time.monotonic()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now: float = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate_per_second)
+            self._updated_at = now
+            self._tokens -= 1
+            # Tokens can go negative - that's the queue of callers waiting their turn.
+            wait_seconds: float = -self._tokens / self.rate_per_second if self._tokens < 0 else 0
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+
+# `Retry-After` can be a number of seconds or an HTTP date. Anything unparseable is ignored.
+def _parse_retry_after(retry_after: typing.Optional[str]) -> typing.Optional[float]:
+    if retry_after is None:
+        return None
+
+    try:
+        return max(0.0, float(retry_after))
+    except ValueError:
+        pass
+
+    try:
+        retry_at: datetime.datetime = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+    return max(0.0, (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
 # # 🥭 RPCCaller class
 #
 # A `RPCCaller` extends the HTTPProvider with better error handling.
 #
+# All requests go through a single `requests.Session`, so connections to the RPC node are pooled and kept
+# alive instead of paying for a new TCP connection and TLS handshake on every call.
+#
+# Independent calls can be sent together as a JSON-RPC batch using `make_batch_request()`, which costs
+# one round-trip per `max_batch_size` calls instead of one per call.
+#
+# Repeated rate-limiting trips a circuit breaker. While it's open, requests fail immediately with a
+# `RateLimitException` so a `CompoundRPCCaller` can move straight on to its next provider.
+#
+# If `requests_per_second` is given, requests are held back to that rate (with bursts of up to
+# `requests_per_second` requests) so the node's own rate limit isn't hit in the first place.
+#
 class RPCCaller(HTTPProvider):
-    def __init__(self, name: str, cluster_url: str, stale_data_pauses_before_retry: typing.Sequence[float], slot_holder: SlotHolder, instruction_reporter: InstructionReporter):
+    def __init__(self, name: str, cluster_url: str, stale_data_pauses_before_retry: typing.Sequence[float], slot_holder: SlotHolder, instruction_reporter: InstructionReporter, max_batch_size: int = _DEFAULT_MAX_BATCH_SIZE, requests_per_second: typing.Optional[float] = None):
         super().__init__(cluster_url)
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.name: str = name
@@ -298,10 +470,33 @@ class RPCCaller(HTTPProvider):
         self.stale_data_pauses_before_retry: typing.Sequence[float] = stale_data_pauses_before_retry
         self.slot_holder: SlotHolder = slot_holder
         self.instruction_reporter: InstructionReporter = instruction_reporter
+        self.max_batch_size: int = max_batch_size
+        self._rate_limit_failures: int = 0
+        self._health_cache: typing.Tuple[float, bool] = (-_HEALTH_CHECK_TTL_SECONDS, False)
+        # Request IDs start at 1, like HTTPProvider's, but without an addition on every request.
+        self._request_counter = itertools.count(1)
+        self._breaker_open_until: float = 0.0
+        self._throttle: typing.Optional[_TokenBucket] = None
+        if requests_per_second is not None:
+            self._throttle = _TokenBucket(requests_per_second, max(1.0, requests_per_second))
+
+        # Retries are handled by the callers (and by moving to the next provider), not by the adapter.
+        #
+        # The pool blocks when all its connections are busy, so a burst of requests waits briefly for a live
+        # connection instead of opening extra ones (each needing DNS, TCP and TLS setup) that the pool would
+        # then throw away.
+        adapter: requests.adapters.HTTPAdapter = requests.adapters.HTTPAdapter(
+            pool_connections=4, pool_maxsize=_MAXIMUM_CONCURRENT_REQUESTS * 2, max_retries=0, pool_block=True)
+        self._session: requests.Session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def require_data_from_fresh_slot(self, latest_slot: typing.Optional[int] = None) -> None:
         self.slot_holder.require_data_from_fresh_slot(latest_slot)
 
+    def _increment_counter_and_get_id(self) -> int:
+        return next(self._request_counter)
+
     def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
         # No pauses specified means this funcitonality is turned off.
         if len(self.stale_data_pauses_before_retry) == 0:
@@ -344,28 +539,93 @@ class RPCCaller(HTTPProvider):
         # raw_response = requests.post(**request_kwargs)
         # return self._after_request(raw_response=raw_response, method=method)
 
-        request_kwargs = self._before_request(method=method, params=params, is_async=False)
-        raw_response = requests.post(**request_kwargs)
+        request_data: str = _encode_request(self._increment_counter_and_get_id(), method, params)
+        response: typing.Dict[str, typing.Any] = json.loads(self.__post(method, request_data))
+        return self.__check_response(method, params, response)
+
+    def make_batch_request(self, calls: typing.Sequence[typing.Tuple[RPCMethod, typing.Sequence[typing.Any]]]) -> typing.Sequence[RPCResponse]:
+        responses: typing.List[RPCResponse] = []
+        for start in range(0, len(calls), self.max_batch_size):
+            responses.extend(self.__make_batch_request(calls[start:start + self.max_batch_size]))
+        return responses
+
+    def __make_batch_request(self, calls: typing.Sequence[typing.Tuple[RPCMethod, typing.Sequence[typing.Any]]]) -> typing.Sequence[RPCResponse]:
+        if len(calls) == 0:
+            return []
+
+        calls_by_id: typing.Dict[int, typing.Tuple[RPCMethod, typing.Sequence[typing.Any]]] = {}
+        for call in calls:
+            calls_by_id[self._increment_counter_and_get_id()] = call
+
+        batch_data: str = "[" + ", ".join(_encode_request(request_id, method, params)
+                                          for request_id, (method, params) in calls_by_id.items()) + "]"
+        methods: str = ",".join(sorted({method for method, _ in calls}))
+        self._logger.debug(f"Making batch request of {len(calls)} calls to: {methods}")
+        batch_response: typing.Any = json.loads(self.__post(RPCMethod(methods), batch_data))
+
+        # A batch that fails as a whole gets a single error object instead of an array.
+        if not isinstance(batch_response, list):
+            self.__check_response(RPCMethod(methods), (), batch_response)
+            raise ClientException(f"Batch of {len(calls)} calls returned a single response: {batch_response}",
+                                  self.name, self.cluster_url)
+
+        # Responses can come back in any order, so match them back up with the calls by their IDs.
+        responses: typing.List[RPCResponse] = []
+        for response in sorted(batch_response, key=lambda response: int(response["id"])):
+            method, params = calls_by_id[int(response["id"])]
+            responses.append(self.__check_response(method, tuple(params), response))
+        return responses
+
+    # Returns the raw bytes of the response body. `json.loads()` takes those directly, so there's no need to
+    # go through `requests`' text decoding for every response.
+    def __post(self, method: RPCMethod, data: str) -> bytes:
+        if time.monotonic() < self._breaker_open_until:
+            raise TooManyRequestsRateLimitException(
+                f"Not calling method '{method}' - paused after repeated rate-limiting.", self.name, self.cluster_url)
+
+        if self._throttle is not None:
+            self._throttle.acquire()
+
+        raw_response = self._session.post(url=self.endpoint_uri, headers=_JSON_HEADERS, data=data,
+                                          timeout=_REQUEST_TIMEOUT_SECONDS)
 
         # Some custom exceptions specifically for rate-limiting. This allows calling code to handle this
         # specific case if they so choose.
         #
         # "You will see HTTP respose codes 429 for too many requests or 413 for too much bandwidth."
         if raw_response.status_code == 413:
+            retry_after: typing.Optional[float] = _parse_retry_after(raw_response.headers.get("Retry-After"))
+            self.__record_rate_limit(retry_after)
             raise TooMuchBandwidthRateLimitException(
-                f"Rate limited (too much bandwidth) calling method '{method}'.", self.name, self.cluster_url)
+                f"Rate limited (too much bandwidth) calling method '{method}'.", self.name, self.cluster_url, retry_after)
         elif raw_response.status_code == 429:
+            retry_after = _parse_retry_after(raw_response.headers.get("Retry-After"))
+            self.__record_rate_limit(retry_after)
             raise TooManyRequestsRateLimitException(
-                f"Rate limited (too many requests) calling method '{method}'.", self.name, self.cluster_url)
+                f"Rate limited (too many requests) calling method '{method}'.", self.name, self.cluster_url, retry_after)
+        self._rate_limit_failures = 0
 
         # Not a rate-limit problem, but maybe there was some other error?
         raw_response.raise_for_status()
 
-        # All seems OK, but maybe the server returned an error? If so, try to pass on as much
-        # information as we can.
-        response_text: str = raw_response.text
-        response: typing.Dict[str, typing.Any] = json.loads(response_text)
+        return raw_response.content
+
+    def __record_rate_limit(self, retry_after: typing.Optional[float]) -> None:
+        self._rate_limit_failures += 1
+        pause: float = 0
+        if self._rate_limit_failures >= _RATE_LIMIT_BREAKER_THRESHOLD:
+            pause_index: int = min(self._rate_limit_failures - _RATE_LIMIT_BREAKER_THRESHOLD,
+                                   len(_RATE_LIMIT_BREAKER_PAUSES_SECONDS) - 1)
+            maximum_pause: float = _RATE_LIMIT_BREAKER_PAUSES_SECONDS[pause_index]
+            pause = random.uniform(maximum_pause / 2, maximum_pause)
+        if retry_after is not None:
+            pause = max(pause, retry_after)
 
+        if pause > 0:
+            self._breaker_open_until = time.monotonic() + pause
+            self._logger.warning(f"Rate-limited {self._rate_limit_failures} times in a row by {self.cluster_url} - pausing requests for {pause:.2f} seconds.")
+
+    def __check_response(self, method: RPCMethod, params: typing.Sequence[typing.Any], response: typing.Dict[str, typing.Any]) -> RPCResponse:
         # Did we get sufficiently up-to-date information? It must be from the last slot we saw or a
         # newer slot.
         #
@@ -379,40 +639,42 @@ class RPCCaller(HTTPProvider):
                         f"Result is from slot: {slot} - latest slot is: {self.slot_holder.latest_slot}")
                     raise StaleSlotException(self.name, self.cluster_url, self.slot_holder.latest_slot, slot)
 
-        if "error" in response:
-            if response["error"] is str:
-                message: str = typing.cast(str, response["error"])
-                raise ClientException(f"Transaction failed: '{message}'", self.name, self.cluster_url)
-            else:
-                error = response["error"]
-                error_message: str = error["message"] if "message" in error else "No message"
-                error_data: typing.Dict[str, typing.Any] = error["data"] if "data" in error else {}
-                error_accounts = error_data["accounts"] if "accounts" in error_data else "No accounts"
-                error_code: int = error["code"] if "code" in error else -1
-                error_err = error_data["err"] if "err" in error_data else "No error text returned"
-                error_logs = error_data["logs"] if "logs" in error_data else "No logs"
-                parameters = json.dumps({"jsonrpc": "2.0", "method": method, "params": params})
-
-                transaction: typing.Optional[Transaction] = None
-                blockhash: typing.Optional[Blockhash] = None
-                if method == "sendTransaction":
-                    transaction = Transaction.deserialize(b64decode(params[0]))
-                    blockhash = transaction.recent_blockhash
-
-                if error_code == -32005:
-                    slots_behind: int = error["data"]["numSlotsBehind"] if "numSlotsBehind" in error["data"] else -1
-                    raise NodeIsBehindException(self.name, self.cluster_url, slots_behind)
-
-                if error_err == "BlockhashNotFound":
-                    raise BlockhashNotFoundException(self.name, self.cluster_url, blockhash)
-
-                if error_err == "AlreadyProcessed":
-                    raise TransactionAlreadyProcessedException(error_message, self.name, self.cluster_url)
-
-                exception_message: str = f"Transaction failed with: '{error_message}'"
-                raise TransactionException(transaction, exception_message, error_code, self.name,
-                                           self.cluster_url, method, parameters, response_text, error_accounts,
-                                           error_err, error_logs, self.instruction_reporter)
+        # All seems OK, but maybe the server returned an error? If so, try to pass on as much
+        # information as we can.
+        error: typing.Any = response.get("error")
+        if error is not None:
+            if isinstance(error, str):
+                raise ClientException(f"Transaction failed: '{error}'", self.name, self.cluster_url)
+
+            error_message: str = error.get("message", "No message")
+            error_data: typing.Dict[str, typing.Any] = error.get("data") or {}
+            error_accounts = error_data.get("accounts", "No accounts")
+            error_code: int = error.get("code", -1)
+            error_err = error_data.get("err", "No error text returned")
+            error_logs = error_data.get("logs", "No logs")
+            parameters = json.dumps({"jsonrpc": "2.0", "method": method, "params": params})
+            response_text: str = json.dumps(response)
+
+            transaction: typing.Optional[Transaction] = None
+            blockhash: typing.Optional[Blockhash] = None
+            if method == "sendTransaction":
+                transaction = Transaction.deserialize(b64decode(params[0]))
+                blockhash = transaction.recent_blockhash
+
+            if error_code == -32005:
+                slots_behind: int = error_data.get("numSlotsBehind", -1)
+                raise NodeIsBehindException(self.name, self.cluster_url, slots_behind)
+
+            if error_err == "BlockhashNotFound":
+                raise BlockhashNotFoundException(self.name, self.cluster_url, blockhash)
+
+            if error_err == "AlreadyProcessed":
+                raise TransactionAlreadyProcessedException(error_message, self.name, self.cluster_url)
+
+            exception_message: str = f"Transaction failed with: '{error_message}'"
+            raise TransactionException(transaction, exception_message, error_code, self.name,
+                                       self.cluster_url, method, parameters, response_text, error_accounts,
+                                       error_err, error_logs, self.instruction_reporter)
 
         if method == "getRecentBlockhash":
             self._logger.debug(f"Recent blockhash fetched: {response}")
@@ -420,6 +682,37 @@ class RPCCaller(HTTPProvider):
         # The call succeeded.
         return typing.cast(RPCResponse, response)
 
+    # Health checks are cached briefly, so code that checks on every pass of a loop doesn't add a round-trip
+    # to each pass. Failed checks are cached too, so an unhealthy node is skipped quickly.
+    def is_connected(self) -> bool:
+        now: float = time.monotonic()
+        checked_at, connected = self._health_cache
+        if now - checked_at < _HEALTH_CHECK_TTL_SECONDS:
+            return connected
+
+        connected = self.__check_health()
+        self._health_cache = (now, connected)
+        return connected
+
+    def __check_health(self) -> bool:
+        try:
+            response = self._session.get(self.health_uri, timeout=_REQUEST_TIMEOUT_SECONDS)
+            response.raise_for_status()
+        except (IOError, requests.HTTPError) as exception:
+            self._logger.error(f"Health check failed with error: {exception}")
+            return False
+
+        return response.ok
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> "RPCCaller":
+        return self
+
+    def __exit__(self, *_: typing.Any) -> None:
+        self.close()
+
     def __str__(self) -> str:
         return f"« RPCCaller [{self.cluster_url}] »"
 
@@ -427,17 +720,40 @@ class RPCCaller(HTTPProvider):
         return f"{self}"
 
 
+# These exceptions show a provider can't currently serve a request, so the request is tried again with the
+# next provider.
+_FAILOVER_EXCEPTIONS: typing.Tuple[typing.Type[Exception], ...] = (
+    requests.exceptions.HTTPError,
+    requests.exceptions.Timeout,
+    RateLimitException,
+    NodeIsBehindException,
+    StaleSlotException,
+    FailedToFetchBlockhashException
+)
+
+
 # # 🥭 CompoundRPCCaller class
 #
 # A `CompoundRPCCaller` will try multiple providers until it succeeds (or the all fail). Should only trap
 # and switch provider on exceptions that show that provider is no longer at the tip of the chain.
 #
+# Successful responses to a few methods whose results don't change are kept in a small LRU cache, so
+# repeating those calls doesn't need another round-trip.
+#
+# Small reads are hedged: if the current provider is slow to respond, the same request is sent to the next
+# provider too and the first success wins. This keeps one stalled node from holding up the caller.
+#
 class CompoundRPCCaller(HTTPProvider):
     def __init__(self, name: str, providers: typing.Sequence[RPCCaller]):
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.__providers: typing.Sequence[RPCCaller] = providers
         self.name: str = name
         self.on_provider_change: typing.Callable[[], None] = lambda: None
+        self._response_cache_lock: threading.Lock = threading.Lock()
+        self._response_cache: typing.OrderedDict[typing.Tuple[str, str], typing.Tuple[float, RPCResponse]] = OrderedDict()
+        self.hedge_after_seconds: float = _HEDGE_AFTER_SECONDS
+        self._hedging_executor_lock: threading.Lock = threading.Lock()
+        self._hedging_executor: typing.Optional[ThreadPoolExecutor] = None
 
     @property
     def current(self) -> RPCCaller:
@@ -462,10 +778,85 @@ class CompoundRPCCaller(HTTPProvider):
         self._logger.debug(f"Told to shift provider - now using: {self.__providers[0]}")
 
     def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+        ttl: typing.Optional[float] = _CACHEABLE_METHOD_TTL_SECONDS.get(method)
+        if ttl is None:
+            return self.__make_uncached_request(method, *params)
+
+        cache_key: typing.Tuple[str, str] = (method, json.dumps(params, sort_keys=True, default=str))
+        now: float = time.monotonic()
+        with self._response_cache_lock:
+            cached: typing.Optional[typing.Tuple[float, RPCResponse]] = self._response_cache.get(cache_key)
+            if cached is not None and now - cached[0] < ttl:
+                self._response_cache.move_to_end(cache_key)
+                return cached[1]
+
+        response: RPCResponse = self.__make_uncached_request(method, *params)
+
+        # An empty result (like a transaction that isn't confirmed yet) can change, so it's never cached.
+        if response.get("result") is not None:
+            with self._response_cache_lock:
+                self._response_cache[cache_key] = (now, response)
+                self._response_cache.move_to_end(cache_key)
+                if len(self._response_cache) > _RESPONSE_CACHE_MAXIMUM_SIZE:
+                    self._response_cache.popitem(last=False)
+        return response
+
+    def __make_uncached_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+        if method in _HEDGED_METHODS and len(self.__providers) > 1:
+            return self.__make_hedged_request(method, *params)
+        return self.__call_providers(lambda provider: provider.make_request(method, *params))
+
+    # The worker threads are only started the first time a request is hedged, so callers with a single
+    # provider never have them. They're shut down by `close()`, or when this `CompoundRPCCaller` is garbage
+    # collected if it's never closed.
+    def __hedging_executor(self) -> ThreadPoolExecutor:
+        with self._hedging_executor_lock:
+            if self._hedging_executor is None:
+                executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=_MAXIMUM_CONCURRENT_REQUESTS,
+                                                                  thread_name_prefix=f"hedge-{self.name}")
+                weakref.finalize(self, executor.shutdown, wait=False)
+                self._hedging_executor = executor
+            return self._hedging_executor
+
+    def __make_hedged_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+        primary, backup = self.__providers[0], self.__providers[1]
+        executor: ThreadPoolExecutor = self.__hedging_executor()
+        pending: typing.Set[Future[RPCResponse]] = {executor.submit(primary.make_request, method, *params)}
+        hedged: bool = False
         all_exceptions: typing.List[Exception] = []
-        for provider in self.__providers:
+        while len(pending) > 0:
+            done, pending = wait(pending, timeout=None if hedged else self.hedge_after_seconds,
+                                 return_when=FIRST_COMPLETED)
+            for future in done:
+                exception: typing.Optional[BaseException] = future.exception()
+                if exception is None:
+                    if len(all_exceptions) > 0:
+                        # The backup succeeded where the primary failed, so carry on using the backup.
+                        self.shift_to_next_provider()
+                    return future.result()
+                if not isinstance(exception, Exception) or not isinstance(exception, _FAILOVER_EXCEPTIONS):
+                    raise exception
+                all_exceptions += [exception]
+                self._logger.info(f"Hedged request failed - {exception}")
+
+            # The primary is either slow or has failed. Either way, it's time to try the backup too.
+            if not hedged:
+                self._logger.debug(f"No success from {primary} after {self.hedge_after_seconds} seconds - also trying {backup}")
+                pending.add(executor.submit(backup.make_request, method, *params))
+                hedged = True
+
+        # Neither of the raced providers succeeded, so try the rest in turn.
+        return self.__call_providers(lambda provider: provider.make_request(method, *params),
+                                     self.__providers[2:], all_exceptions)
+
+    def make_batch_request(self, calls: typing.Sequence[typing.Tuple[RPCMethod, typing.Sequence[typing.Any]]]) -> typing.Sequence[RPCResponse]:
+        return self.__call_providers(lambda provider: provider.make_batch_request(calls))
+
+    def __call_providers(self, call: typing.Callable[[RPCCaller], TResult], providers: typing.Optional[typing.Sequence[RPCCaller]] = None, previous_exceptions: typing.Sequence[Exception] = ()) -> TResult:
+        all_exceptions: typing.List[Exception] = [*previous_exceptions]
+        for provider in (self.__providers if providers is None else providers):
             try:
-                result = provider.make_request(method, *params)
+                result = call(provider)
                 successful_index: int = self.__providers.index(provider)
                 if successful_index != 0:
                     # Rebase the providers' list so we continue to use this successful one (until it fails)
@@ -473,11 +864,7 @@ class CompoundRPCCaller(HTTPProvider):
                     self.on_provider_change()
                     self._logger.debug(f"Shifted provider - now using: {self.__providers[0]}")
                 return result
-            except (requests.exceptions.HTTPError,
-                    RateLimitException,
-                    NodeIsBehindException,
-                    StaleSlotException,
-                    FailedToFetchBlockhashException) as exception:
+            except _FAILOVER_EXCEPTIONS as exception:
                 all_exceptions += [exception]
                 self._logger.info(f"Moving to next provider - {provider} gave {exception}")
 
@@ -490,6 +877,14 @@ class CompoundRPCCaller(HTTPProvider):
                 return True
         return False
 
+    def close(self) -> None:
+        with self._hedging_executor_lock:
+            if self._hedging_executor is not None:
+                self._hedging_executor.shutdown(wait=False)
+                self._hedging_executor = None
+        for provider in self.__providers:
+            provider.close()
+
     def __str__(self) -> str:
         return f"« CompoundRPCCaller with {len(self.__providers)} providers - current head is: {self.__providers[0]} »"
 
@@ -497,6 +892,17 @@ class CompoundRPCCaller(HTTPProvider):
         return f"{self}"
 
 
+# solana-py turns every key into a string with `str()`, which base58-encodes it again each time. Keys are
+# encoded here instead, through `encode_key()`'s cache, so the same keys aren't re-encoded on every call.
+def _key_text(key: typing.Union[PublicKey, str]) -> str:
+    return key if isinstance(key, str) else encode_key(key)
+
+
+def _is_fully_signed(transaction: Transaction) -> bool:
+    return transaction.recent_blockhash is not None and len(transaction.signatures) > 0 \
+        and all(pair.signature is not None for pair in transaction.signatures)
+
+
 # This is purely to pass `maxRetries`: 0 in the TxOpts. (solana-py doesn't currently support this but Solana does.)
 class _MaxRetriesZeroClient(Client):
     def _send_raw_transaction_args(
@@ -519,7 +925,7 @@ class _MaxRetriesZeroClient(Client):
 
 
 class BetterClient:
-    def __init__(self, client: Client, name: str, cluster_name: str, commitment: Commitment, skip_preflight: bool, encoding: str, blockhash_cache_duration: int, rpc_caller: CompoundRPCCaller) -> None:
+    def __init__(self, client: Client, name: str, cluster_name: str, commitment: Commitment, skip_preflight: bool, encoding: str, blockhash_cache_duration: typing.Optional[int], rpc_caller: CompoundRPCCaller, requests_per_second: typing.Optional[float] = None) -> None:
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.compatible_client: Client = client
         self.name: str = name
@@ -527,22 +933,40 @@ class BetterClient:
         self.commitment: Commitment = commitment
         self.skip_preflight: bool = skip_preflight
         self.encoding: str = encoding
-        self.blockhash_cache_duration: int = blockhash_cache_duration
+        self.blockhash_cache_duration: typing.Optional[int] = blockhash_cache_duration
         self.rpc_caller: CompoundRPCCaller = rpc_caller
+        self.requests_per_second: typing.Optional[float] = requests_per_second
+
+        # Every provider is given the same reporter and pauses, so these are plain attributes rather than
+        # properties that go through the current provider on every access.
+        self.instruction_reporter: InstructionReporter = rpc_caller.current.instruction_reporter
+        self.stale_data_pauses_before_retry: typing.Sequence[float] = rpc_caller.current.stale_data_pauses_before_retry
+
+        self._blockhash_cache: typing.Optional[typing.Tuple[float, Blockhash]] = None
+        self._blockhash_refresh_lock: threading.Lock = threading.Lock()
+        self._blockhash_refreshing: bool = False
+        self._last_sent_with_reused_blockhash: typing.Optional[typing.Tuple[Blockhash, typing.List[TransactionInstruction]]] = None
+        self._rent_cache: typing.Dict[typing.Tuple[int, str], typing.Tuple[float, int]] = {}
+
+        self._account_batch_lock: threading.Lock = threading.Lock()
+        self._account_batch: typing.Deque[typing.Tuple[typing.Union[PublicKey, str], Future[typing.Any]]] = deque()
+        self._account_batch_timer: typing.Optional[threading.Timer] = None
 
     @staticmethod
-    def from_configuration(name: str, cluster_name: str, cluster_urls: typing.Sequence[str], commitment: Commitment, skip_preflight: bool, encoding: str, blockhash_cache_duration: int, stale_data_pauses_before_retry: typing.Sequence[float], instruction_reporter: InstructionReporter) -> "BetterClient":
+    def from_configuration(name: str, cluster_name: str, cluster_urls: typing.Sequence[str], commitment: Commitment, skip_preflight: bool, encoding: str, blockhash_cache_duration: typing.Optional[int], stale_data_pauses_before_retry: typing.Sequence[float], instruction_reporter: InstructionReporter, requests_per_second: typing.Optional[float] = None) -> "BetterClient":
         slot_holder: SlotHolder = SlotHolder()
         rpc_callers: typing.List[RPCCaller] = []
         for cluster_url in cluster_urls:
             rpc_caller: RPCCaller = RPCCaller(name, cluster_url, stale_data_pauses_before_retry,
-                                              slot_holder, instruction_reporter)
+                                              slot_holder, instruction_reporter,
+                                              requests_per_second=requests_per_second)
             rpc_callers += [rpc_caller]
 
         provider: CompoundRPCCaller = CompoundRPCCaller(name, rpc_callers)
+        solana_blockhash_cache_duration: int = blockhash_cache_duration or 0
         blockhash_cache: typing.Union[BlockhashCache, bool] = False
-        if blockhash_cache_duration > 0:
-            blockhash_cache = BlockhashCache(blockhash_cache_duration)
+        if solana_blockhash_cache_duration > 0:
+            blockhash_cache = BlockhashCache(solana_blockhash_cache_duration)
         client: Client = _MaxRetriesZeroClient(cluster_url, commitment=commitment, blockhash_cache=blockhash_cache)
         client._provider = provider
 
@@ -550,13 +974,13 @@ class BetterClient:
             if client.blockhash_cache:
                 # Clear out the blockhash cache on retrying
                 logging.debug("Replacing client blockhash cache.")
-                client.blockhash_cache = BlockhashCache(blockhash_cache_duration)
+                client.blockhash_cache = BlockhashCache(solana_blockhash_cache_duration)
                 blockhash_resp = client.get_recent_blockhash(Finalized)
                 client._process_blockhash_resp(blockhash_resp, used_immediately=False)
 
         provider.on_provider_change = __on_provider_change
 
-        return BetterClient(client, name, cluster_name, commitment, skip_preflight, encoding, blockhash_cache_duration, provider)
+        return BetterClient(client, name, cluster_name, commitment, skip_preflight, encoding, blockhash_cache_duration, provider, requests_per_second)
 
     @property
     def cluster_url(self) -> str:
@@ -566,29 +990,76 @@ class BetterClient:
     def cluster_urls(self) -> typing.Sequence[str]:
         return [rpc_caller.cluster_url for rpc_caller in self.rpc_caller.all_providers]
 
-    @property
-    def instruction_reporter(self) -> InstructionReporter:
-        return self.rpc_caller.current.instruction_reporter
-
-    @property
-    def stale_data_pauses_before_retry(self) -> typing.Sequence[float]:
-        return self.rpc_caller.current.stale_data_pauses_before_retry
-
     def require_data_from_fresh_slot(self) -> None:
         self.rpc_caller.current.require_data_from_fresh_slot()
 
+    # Closes every provider's pooled connections. The client shouldn't be used after this.
+    def close(self) -> None:
+        self.rpc_caller.close()
+
+    def __enter__(self) -> "BetterClient":
+        return self
+
+    def __exit__(self, *_: typing.Any) -> None:
+        self.close()
+
     def get_balance(self, pubkey: typing.Union[PublicKey, str], commitment: Commitment = UnspecifiedCommitment) -> Decimal:
         resolved_commitment, _ = self.__resolve_defaults(commitment)
-        response = self.compatible_client.get_balance(pubkey, resolved_commitment)
+        response = self.compatible_client.get_balance(_key_text(pubkey), resolved_commitment)
         value = Decimal(response["result"]["value"])
         return value / SOL_DECIMAL_DIVISOR
 
+    def get_balances(self, pubkeys: typing.Sequence[typing.Union[PublicKey, str]], commitment: Commitment = UnspecifiedCommitment) -> typing.Sequence[Decimal]:
+        resolved_commitment, _ = self.__resolve_defaults(commitment)
+        responses = self.__make_batch_request([self.compatible_client._get_balance_args(_key_text(pubkey), resolved_commitment)
+                                               for pubkey in pubkeys])
+        return [Decimal(response["result"]["value"]) / SOL_DECIMAL_DIVISOR for response in responses]
+
     def get_account_info(self, pubkey: typing.Union[PublicKey, str], commitment: Commitment = UnspecifiedCommitment,
                          encoding: str = UnspecifiedEncoding, data_slice: typing.Optional[DataSliceOpts] = None) -> typing.Any:
         resolved_commitment, resolved_encoding = self.__resolve_defaults(commitment, encoding)
-        response = self.compatible_client.get_account_info(pubkey, resolved_commitment, resolved_encoding, data_slice)
+        response = self.compatible_client.get_account_info(_key_text(pubkey), resolved_commitment, resolved_encoding, data_slice)
         return response["result"]
 
+    # Fetches each account with its own `getAccountInfo` call, but with the calls running concurrently so
+    # fetching K accounts takes roughly one round-trip rather than K. Unlike `get_multiple_accounts()` this
+    # doesn't rely on the provider's limit on accounts per call, and providers that bill batches per
+    # request cost no more.
+    def get_account_infos(self, pubkeys: typing.Sequence[typing.Union[PublicKey, str]], commitment: Commitment = UnspecifiedCommitment,
+                          encoding: str = UnspecifiedEncoding, data_slice: typing.Optional[DataSliceOpts] = None) -> typing.Sequence[typing.Any]:
+        if len(pubkeys) == 0:
+            return []
+
+        def __get_account_info(pubkey: typing.Union[PublicKey, str]) -> typing.Any:
+            return self.get_account_info(pubkey, commitment, encoding, data_slice)
+
+        with ThreadPoolExecutor(max_workers=min(len(pubkeys), _MAXIMUM_CONCURRENT_REQUESTS)) as executor:
+            return list(executor.map(__get_account_info, pubkeys))
+
+    # Queues the account to be fetched along with any others requested in the next few milliseconds, all in
+    # a single `getMultipleAccounts` call. The returned `Future` resolves to the same structure
+    # `get_account_info()` returns, using the client's default commitment and encoding.
+    #
+    # It's for callers that read many single accounts from different threads at once. Nothing in this
+    # package does that yet: the polling model state builders already read all their accounts with one
+    # `AccountInfo.load_multiple()`, and `AccountInfo.load()` stays a direct read because the batching window
+    # would add latency to every single-account read. No timer thread is started until this is first called.
+    def get_account_info_batched(self, pubkey: typing.Union[PublicKey, str]) -> Future[typing.Any]:
+        future: Future[typing.Any] = Future()
+        full_batch: typing.List[typing.Tuple[typing.Union[PublicKey, str], Future[typing.Any]]] = []
+        with self._account_batch_lock:
+            self._account_batch.append((pubkey, future))
+            if len(self._account_batch) >= _ACCOUNT_BATCH_MAXIMUM_SIZE:
+                # A full batch is sent straight away, from this thread, rather than waiting for the timer.
+                full_batch = self.__take_account_batch()
+            elif self._account_batch_timer is None:
+                self._account_batch_timer = threading.Timer(_ACCOUNT_BATCH_WINDOW_SECONDS, self.__flush_account_batch)
+                self._account_batch_timer.daemon = True
+                self._account_batch_timer.start()
+
+        self.__fetch_account_batch(full_batch)
+        return future
+
     def get_confirmed_signatures_for_address2(self, account: typing.Union[str, Keypair, PublicKey], before: typing.Optional[str] = None, until: typing.Optional[str] = None, limit: typing.Optional[int] = None) -> typing.Sequence[str]:
         response = self.compatible_client.get_confirmed_signature_for_address2(account, before, until, limit)
         return [result["signature"] for result in response["result"]]
@@ -598,10 +1069,43 @@ class BetterClient:
         response = self.compatible_client.get_confirmed_transaction(signature, resolved_encoding)
         return response["result"]
 
+    def get_multiple_confirmed_transactions(self, signatures: typing.Sequence[str], encoding: str = "json") -> typing.Sequence[typing.Any]:
+        _, resolved_encoding = self.__resolve_defaults(None, encoding)
+        responses = self.__make_batch_request([self.compatible_client._get_confirmed_transaction_args(signature, resolved_encoding)
+                                               for signature in signatures])
+        return [response["result"] for response in responses]
+
+    # Returns the status of each signature (or None if the node doesn't know about it), in the same order as
+    # the signatures. Only the node's recent status cache is searched, not its full transaction history.
+    def get_signature_statuses(self, signatures: typing.Sequence[str]) -> typing.Sequence[typing.Optional[typing.Dict[str, typing.Any]]]:
+        statuses: typing.List[typing.Optional[typing.Dict[str, typing.Any]]] = []
+        for start in range(0, len(signatures), _MAXIMUM_SIGNATURE_STATUSES_PER_CALL):
+            chunk: typing.List[typing.Union[str, bytes]] = [
+                *signatures[start:start + _MAXIMUM_SIGNATURE_STATUSES_PER_CALL]]
+            response = self.compatible_client.get_signature_statuses(chunk)
+            statuses.extend(response["result"]["value"])
+        return statuses
+
     def get_minimum_balance_for_rent_exemption(self, size: int, commitment: Commitment = UnspecifiedCommitment) -> int:
         resolved_commitment, _ = self.__resolve_defaults(commitment)
-        response = self.compatible_client.get_minimum_balance_for_rent_exemption(size, resolved_commitment)
-        return int(response["result"])
+        cache_key: typing.Tuple[int, str] = (size, str(resolved_commitment))
+        cached: typing.Optional[typing.Tuple[float, int]] = self._rent_cache.get(cache_key)
+        now: float = time.monotonic()
+        if cached is not None and now - cached[0] < _RENT_EXEMPTION_TTL_SECONDS:
+            return cached[1]
+
+        try:
+            response = self.compatible_client.get_minimum_balance_for_rent_exemption(size, resolved_commitment)
+        except (RateLimitException, CompoundException):
+            # Rate-limiting from every provider shows up as a CompoundException. A stale value is much better
+            # than no value here.
+            if cached is not None:
+                return cached[1]
+            raise
+
+        minimum_balance: int = int(response["result"])
+        self._rent_cache[cache_key] = (now, minimum_balance)
+        return minimum_balance
 
     def get_program_accounts(self, pubkey: typing.Union[str, PublicKey],
                              commitment: Commitment = UnspecifiedCommitment,
@@ -611,7 +1115,7 @@ class BetterClient:
                              memcmp_opts: typing.Optional[typing.List[MemcmpOpts]] = None) -> typing.Any:
         resolved_commitment, resolved_encoding = self.__resolve_defaults(commitment, encoding)
         response = self.compatible_client.get_program_accounts(
-            pubkey, resolved_commitment, resolved_encoding, data_slice, data_size, memcmp_opts)
+            _key_text(pubkey), resolved_commitment, resolved_encoding, data_slice, data_size, memcmp_opts)
         return response["result"]
 
     def get_recent_blockhash(self, commitment: Commitment = UnspecifiedCommitment) -> Blockhash:
@@ -621,7 +1125,7 @@ class BetterClient:
 
     def get_token_account_balance(self, pubkey: typing.Union[str, PublicKey], commitment: Commitment = UnspecifiedCommitment) -> Decimal:
         resolved_commitment, _ = self.__resolve_defaults(commitment)
-        response = self.compatible_client.get_token_account_balance(pubkey, resolved_commitment)
+        response = self.compatible_client.get_token_account_balance(_key_text(pubkey), resolved_commitment)
         value = Decimal(response["result"]["value"]["amount"])
         decimal_places = response["result"]["value"]["decimals"]
         divisor = Decimal(10 ** decimal_places)
@@ -635,11 +1139,11 @@ class BetterClient:
     def get_multiple_accounts(self, pubkeys: typing.List[typing.Union[PublicKey, str]], commitment: Commitment = UnspecifiedCommitment,
                               encoding: str = UnspecifiedEncoding, data_slice: typing.Optional[DataSliceOpts] = None) -> typing.Any:
         resolved_commitment, resolved_encoding = self.__resolve_defaults(commitment, encoding)
-        response = self.compatible_client.get_multiple_accounts(
-            pubkeys, resolved_commitment, resolved_encoding, data_slice)
+        keys: typing.List[typing.Union[PublicKey, str]] = [_key_text(pubkey) for pubkey in pubkeys]
+        response = self.compatible_client.get_multiple_accounts(keys, resolved_commitment, resolved_encoding, data_slice)
         return response["result"]["value"]
 
-    def send_transaction(self, transaction: Transaction, *signers: Keypair, opts: TxOpts = TxOpts(preflight_commitment=UnspecifiedCommitment)) -> str:
+    def send_transaction(self, transaction: Transaction, *signers: Keypair, opts: typing.Optional[TxOpts] = None) -> str:
         # This method is an exception to the normal exception-handling to fail over to the next RPC provider.
         #
         # Normal RPC exceptions just move on to the next RPC provider and try again. That won't work with the
@@ -647,22 +1151,31 @@ class BetterClient:
         # indicates a problem with the current node returning the stale blockhash anyway.
         #
         # What we want to do in this situation is: retry the same transaction (which we know for certain failed)
-        # but retry it with the next provider in the list, with a fresh recent_blockhash. (Setting the transaction's
-        # recent_blockhash to None makes the client fetch a fresh one.)
+        # but retry it with the next provider in the list, with a fresh recent_blockhash.
+        #
+        # The compatible client fetches a fresh blockhash for every send (overwriting the transaction's own
+        # `recent_blockhash`) unless one is passed in, so if no blockhash cache duration is configured a
+        # recently-fetched blockhash is passed in explicitly.
+        #
+        # A transaction that's already been signed can be passed in with no signers. It's then sent exactly as it
+        # is, without fetching a blockhash or signing it again - but that also means it can't be retried with a
+        # fresh blockhash.
+        pre_signed: bool = len(signers) == 0 and _is_fully_signed(transaction)
+        proper_opts: TxOpts = self.__resolve_transaction_options(opts or _DEFAULT_TX_OPTS)
         last_exception: BlockhashNotFoundException
         for provider in self.rpc_caller.all_providers:
             try:
-                proper_commitment: Commitment = opts.preflight_commitment
-                proper_skip_preflight = opts.skip_preflight
-                if proper_commitment == UnspecifiedCommitment:
-                    proper_commitment = self.commitment
-                    proper_skip_preflight = self.skip_preflight
-
-                proper_opts = TxOpts(preflight_commitment=proper_commitment,
-                                     skip_confirmation=opts.skip_confirmation,
-                                     skip_preflight=proper_skip_preflight)
-
-                response = self.compatible_client.send_transaction(transaction, *signers, opts=proper_opts)
+                if pre_signed:
+                    response = self.compatible_client.send_raw_transaction(transaction.serialize(), opts=proper_opts)
+                else:
+                    recent_blockhash: typing.Optional[Blockhash] = None
+                    if self.blockhash_cache_duration is None and not self.compatible_client.blockhash_cache:
+                        recent_blockhash = self.__cached_recent_blockhash(transaction.instructions)
+
+                    response = self.compatible_client.send_transaction(
+                        transaction, *signers, opts=proper_opts, recent_blockhash=recent_blockhash)
+                    if recent_blockhash is not None:
+                        self._last_sent_with_reused_blockhash = (recent_blockhash, [*transaction.instructions])
                 signature: str = str(response["result"])
 
                 if signature != _STUB_TRANSACTION_SIGNATURE:
@@ -679,31 +1192,136 @@ class BetterClient:
             except BlockhashNotFoundException as blockhash_not_found_exception:
                 self._logger.debug(
                     f"Trying next provider after intercepting blockhash exception on provider {provider}: {blockhash_not_found_exception}")
+                if pre_signed:
+                    raise
                 last_exception = blockhash_not_found_exception
                 transaction.recent_blockhash = None
+                self._blockhash_cache = None
                 self.rpc_caller.shift_to_next_provider()
 
         raise last_exception
 
+    # All outstanding transactions are checked with a single `getSignatureStatuses` call on each pass, so a
+    # pass costs one round-trip (and only fetches statuses, not whole transactions) no matter how many
+    # transactions are being waited on. Passes start close together and back off exponentially so long
+    # waits don't hammer the RPC node. A transaction counts as confirmed once its status is at least
+    # 'confirmed' - 'processed' transactions can still be dropped.
     def wait_for_confirmation(self, transaction_ids: typing.Sequence[str], max_wait_in_seconds: int = 60) -> typing.Sequence[str]:
         self._logger.info(f"Waiting up to {max_wait_in_seconds} seconds for {transaction_ids}.")
         all_confirmed: typing.List[str] = []
+        if len(transaction_ids) == 0:
+            return all_confirmed
+
         start_time: datetime.datetime = datetime.datetime.now()
         cutoff: datetime.datetime = start_time + datetime.timedelta(seconds=max_wait_in_seconds)
-        for transaction_id in transaction_ids:
-            while datetime.datetime.now() < cutoff:
-                time.sleep(1)
-                confirmed = self.get_confirmed_transaction(transaction_id)
-                if confirmed is not None:
+        pending: typing.List[str] = list(transaction_ids)
+        pause: float = _CONFIRMATION_INITIAL_PAUSE_SECONDS
+        while len(pending) > 0 and datetime.datetime.now() < cutoff:
+            remaining: float = (cutoff - datetime.datetime.now()).total_seconds()
+            time.sleep(max(0, min(pause + random.uniform(0, pause * 0.25), remaining)))
+            pause = min(pause * 2, _CONFIRMATION_MAXIMUM_PAUSE_SECONDS)
+            still_pending: typing.List[str] = []
+            for transaction_id, status in zip(pending, self.get_signature_statuses(pending)):
+                if status is not None and status.get("confirmationStatus") != "processed":
                     self._logger.info(
                         f"Confirmed {transaction_id} after {datetime.datetime.now() - start_time} seconds.")
-                    all_confirmed += [transaction_id]
-                    break
+                    all_confirmed.append(transaction_id)
+                else:
+                    still_pending.append(transaction_id)
+            pending = still_pending
 
-        if len(all_confirmed) != len(transaction_ids):
-            self._logger.info(f"Timed out after {max_wait_in_seconds} seconds waiting on transaction {transaction_id}.")
+        if len(pending) > 0:
+            self._logger.info(f"Timed out after {max_wait_in_seconds} seconds waiting on transactions {pending}.")
         return all_confirmed
 
+    def __resolve_transaction_options(self, opts: TxOpts) -> TxOpts:
+        if opts.preflight_commitment != UnspecifiedCommitment:
+            return opts
+
+        return TxOpts(preflight_commitment=self.commitment,
+                      skip_confirmation=opts.skip_confirmation,
+                      skip_preflight=self.skip_preflight)
+
+    # Sending the same instructions again with the same blockhash would give the same signature, and the node
+    # would reject it as already processed. (Think of `settle()` or `crank()` called twice in a row.) A fresh
+    # blockhash is fetched for those instead. Only the previous send is compared, so this doesn't catch an
+    # identical transaction with a different one sent in between.
+    def __cached_recent_blockhash(self, instructions: typing.Sequence[TransactionInstruction]) -> Blockhash:
+        now: float = time.monotonic()
+        cached: typing.Optional[typing.Tuple[float, Blockhash]] = self._blockhash_cache
+        if cached is not None:
+            fetched_at, blockhash = cached
+            age: float = now - fetched_at
+            if age < _RECENT_BLOCKHASH_MAXIMUM_AGE_SECONDS and not self.__last_sent_with(blockhash, instructions):
+                if age >= _RECENT_BLOCKHASH_TTL_SECONDS:
+                    self.__refresh_recent_blockhash_in_background()
+                return blockhash
+
+        return self.__fetch_recent_blockhash()
+
+    def __last_sent_with(self, blockhash: Blockhash, instructions: typing.Sequence[TransactionInstruction]) -> bool:
+        last_sent: typing.Optional[typing.Tuple[Blockhash, typing.List[TransactionInstruction]]] = self._last_sent_with_reused_blockhash
+        return last_sent is not None and last_sent[0] == blockhash and last_sent[1] == [*instructions]
+
+    def __fetch_recent_blockhash(self) -> Blockhash:
+        # This is the same commitment the compatible client uses when it fetches its own blockhashes.
+        fetched_at: float = time.monotonic()
+        blockhash = self.get_recent_blockhash(Finalized)
+        self._blockhash_cache = (fetched_at, blockhash)
+        return blockhash
+
+    def __refresh_recent_blockhash_in_background(self) -> None:
+        with self._blockhash_refresh_lock:
+            if self._blockhash_refreshing:
+                return
+            self._blockhash_refreshing = True
+
+        def __refresh() -> None:
+            try:
+                self.__fetch_recent_blockhash()
+            except Exception as exception:
+                self._logger.warning(f"Background refresh of recent blockhash failed: {exception}")
+            finally:
+                self._blockhash_refreshing = False
+
+        threading.Thread(target=__refresh, daemon=True).start()
+
+    # Must be called holding `_account_batch_lock`.
+    def __take_account_batch(self) -> typing.List[typing.Tuple[typing.Union[PublicKey, str], Future[typing.Any]]]:
+        if self._account_batch_timer is not None:
+            self._account_batch_timer.cancel()
+            self._account_batch_timer = None
+        batch = list(self._account_batch)
+        self._account_batch.clear()
+        return batch
+
+    def __flush_account_batch(self) -> None:
+        with self._account_batch_lock:
+            batch = self.__take_account_batch()
+        self.__fetch_account_batch(batch)
+
+    def __fetch_account_batch(self, batch: typing.Sequence[typing.Tuple[typing.Union[PublicKey, str], Future[typing.Any]]]) -> None:
+        if len(batch) == 0:
+            return
+
+        try:
+            resolved_commitment, resolved_encoding = self.__resolve_defaults(None, None)
+            keys: typing.List[typing.Union[PublicKey, str]] = [_key_text(pubkey) for pubkey, _ in batch]
+            response = self.compatible_client.get_multiple_accounts(keys, resolved_commitment, resolved_encoding)
+            context = response["result"]["context"]
+            values = response["result"]["value"]
+        except Exception as exception:
+            for _, future in batch:
+                future.set_exception(exception)
+            return
+
+        for (_, future), value in zip(batch, values):
+            future.set_result({"context": context, "value": value})
+
+    def __make_batch_request(self, calls: typing.Sequence[typing.Sequence[typing.Any]]) -> typing.Sequence[RPCResponse]:
+        # Each call is in the (method, *params) form the compatible client's argument builders return.
+        return self.rpc_caller.make_batch_request([(RPCMethod(call[0]), call[1:]) for call in calls])
+
     def __resolve_defaults(self, commitment: typing.Optional[Commitment], encoding: typing.Optional[str] = None) -> typing.Tuple[Commitment, str]:
         if commitment is None or commitment == UnspecifiedCommitment:
             commitment = self.commitment
@@ -75,7 +75,7 @@ class ContextBuilder:
         parser.add_argument("--encoding", type=str, default=None,
                             help="Encoding to request when receiving data from Solana (options are 'base58' (slow), 'base64', 'base64+zstd', or 'jsonParsed')")
         parser.add_argument("--blockhash-cache-duration", type=int,
-                            help="How long (in seconds) to cache 'recent' blockhashes")
+                            help="How long (in seconds) to cache 'recent' blockhashes (0 fetches a fresh one for every transaction)")
         parser.add_argument("--stale-data-pause-before-retry", type=Decimal,
                             help="How long (in seconds, e.g. 0.1) to pause after retrieving stale data before retrying")
         parser.add_argument("--stale-data-maximum-retries", type=int,
@@ -84,6 +84,8 @@ class ContextBuilder:
                             help="Maximum number of addresses to send in a single call to getMultipleAccounts()")
         parser.add_argument("--gma-chunk-pause", type=Decimal, default=None,
                             help="number of seconds to pause between successive getMultipleAccounts() calls to avoid rate limiting")
+        parser.add_argument("--requests-per-second", type=float, default=None,
+                            help="Maximum number of RPC requests to send to each RPC cluster URL per second (default is no limit)")
 
         parser.add_argument("--token-data-file", type=str, default=SPLTokenLookup.DefaultDataFilepath,
                             help="data file that contains token symbols, names, mints and decimals (format is same as https://raw.githubusercontent.com/solana-labs/token-list/main/src/tokens/solana.tokenlist.json)")
@@ -112,6 +114,7 @@ class ContextBuilder:
         gma_chunk_size: typing.Optional[Decimal] = args.gma_chunk_size
         gma_chunk_pause: typing.Optional[Decimal] = args.gma_chunk_pause
         token_filename: str = args.token_data_file
+        requests_per_second: typing.Optional[float] = args.requests_per_second
 
         # Do this here so build() only ever has to handle the sequence of retry times. (It gets messy
         # passing around the sequnce *plus* the data to reconstruct it for build().)
@@ -126,7 +129,7 @@ class ContextBuilder:
                                                 actual_stale_data_pauses_before_retry,
                                                 group_name, group_address, mango_program_address,
                                                 serum_program_address, gma_chunk_size, gma_chunk_pause,
-                                                token_filename)
+                                                token_filename, requests_per_second)
         logging.debug(f"{context}")
 
         return context
@@ -143,7 +146,7 @@ class ContextBuilder:
                                     context.client.stale_data_pauses_before_retry,
                                     group_name, None, None, None,
                                     context.gma_chunk_size, context.gma_chunk_pause,
-                                    SPLTokenLookup.DefaultDataFilepath)
+                                    SPLTokenLookup.DefaultDataFilepath, context.client.requests_per_second)
 
     @staticmethod
     def forced_to_devnet(context: Context) -> Context:
@@ -158,7 +161,8 @@ class ContextBuilder:
                                                                context.client.encoding,
                                                                context.client.blockhash_cache_duration,
                                                                context.client.stale_data_pauses_before_retry,
-                                                               context.client.instruction_reporter)
+                                                               context.client.instruction_reporter,
+                                                               context.client.requests_per_second)
 
         return fresh_context
 
@@ -175,7 +179,8 @@ class ContextBuilder:
                                                                context.client.encoding,
                                                                context.client.blockhash_cache_duration,
                                                                context.client.stale_data_pauses_before_retry,
-                                                               context.client.instruction_reporter)
+                                                               context.client.instruction_reporter,
+                                                               context.client.requests_per_second)
 
         return fresh_context
 
@@ -188,7 +193,8 @@ class ContextBuilder:
               group_name: typing.Optional[str] = None, group_address: typing.Optional[PublicKey] = None,
               program_address: typing.Optional[PublicKey] = None, serum_program_address: typing.Optional[PublicKey] = None,
               gma_chunk_size: typing.Optional[Decimal] = None, gma_chunk_pause: typing.Optional[Decimal] = None,
-              token_filename: str = SPLTokenLookup.DefaultDataFilepath) -> "Context":
+              token_filename: str = SPLTokenLookup.DefaultDataFilepath,
+              requests_per_second: typing.Optional[float] = None) -> "Context":
         def __public_key_or_none(address: typing.Optional[str]) -> typing.Optional[PublicKey]:
             if address is not None and address != "":
                 return PublicKey(address)
@@ -207,7 +213,7 @@ class ContextBuilder:
 
         actual_commitment: str = commitment or "processed"
         actual_encoding: str = encoding or "base64"
-        actual_blockhash_cache_duration: int = blockhash_cache_duration or 0
+        actual_blockhash_cache_duration: typing.Optional[int] = blockhash_cache_duration
         actual_stale_data_pauses_before_retry: typing.Sequence[float] = stale_data_pauses_before_retry or []
 
         actual_cluster_urls: typing.Optional[typing.Sequence[str]] = cluster_urls
@@ -304,4 +310,4 @@ class ContextBuilder:
                 devnet_serum_market_lookup])
         market_lookup: MarketLookup = all_market_lookup
 
-        return Context(actual_name, actual_cluster, actual_cluster_urls, actual_skip_preflight, actual_commitment, actual_encoding, actual_blockhash_cache_duration, actual_stale_data_pauses_before_retry, actual_program_address, actual_serum_program_address, actual_group_name, actual_group_address, actual_gma_chunk_size, actual_gma_chunk_pause, instrument_lookup, market_lookup)
+        return Context(actual_name, actual_cluster, actual_cluster_urls, actual_skip_preflight, actual_commitment, actual_encoding, actual_blockhash_cache_duration, actual_stale_data_pauses_before_retry, actual_program_address, actual_serum_program_address, actual_group_name, actual_group_address, actual_gma_chunk_size, actual_gma_chunk_pause, instrument_lookup, market_lookup, requests_per_second)
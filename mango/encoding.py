@@ -16,6 +16,7 @@
 
 import base64
 import base58
+import functools
 import typing
 import zstandard
 
@@ -64,8 +65,16 @@ def encode_binary(decoded: bytes) -> typing.Sequence[str]:
 # ## encode_key() function
 #
 # Encodes a `PublicKey` in the proper way for RPC calls.
+#
+# The same few keys (groups, owners, markets) get encoded over and over, so the base58 encoding is
+# cached. `PublicKey` isn't hashable so the cache is keyed on the key's bytes.
 def encode_key(key: PublicKey) -> str:
-    return str(key)
+    return _encode_key_bytes(bytes(key))
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_key_bytes(key_bytes: bytes) -> str:
+    return base58.b58encode(key_bytes).decode("utf-8")
 
 
 # ## encode_int() function
@@ -17,6 +17,7 @@ import logging
 import typing
 
 from decimal import Decimal
+from functools import cached_property
 from solana.publickey import PublicKey
 
 from .accountinfo import AccountInfo
@@ -197,7 +198,8 @@ class Group(AddressableAccount):
     def shared_quote_token(self) -> Token:
         return Token.ensure(self.shared_quote.token)
 
-    @property
+    # Every `Account` parsed for this `Group` needs the MNGO token, so only search for it once.
+    @cached_property
     def liquidity_incentive_token_bank(self) -> TokenBank:
         for token_bank in self.tokens:
             if token_bank.token.symbol_matches("MNGO"):
@@ -219,16 +221,8 @@ class Group(AddressableAccount):
 
     @property
     def slots_by_index(self) -> typing.Sequence[typing.Optional[GroupSlot]]:
-        mapped_items: typing.List[typing.Optional[GroupSlot]] = []
-        slot_counter = 0
-        for available in self.slot_indices:
-            if available:
-                mapped_items += [self.slots[slot_counter]]
-                slot_counter += 1
-            else:
-                mapped_items += [None]
-
-        return mapped_items
+        slots: typing.Iterator[GroupSlot] = iter(self.slots)
+        return [next(slots) if available else None for available in self.slot_indices]
 
     @property
     def base_tokens(self) -> typing.Sequence[TokenBank]:
@@ -38,6 +38,7 @@ class MarketMaker:
                  redeem_threshold: typing.Optional[Decimal]) -> None:
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.wallet: mango.Wallet = wallet
+        self._payer: mango.CombinableInstructions = mango.CombinableInstructions.from_wallet(wallet)
         self.market: mango.Market = market
         self.market_instruction_builder: mango.MarketInstructionBuilder = market_instruction_builder
         self.desired_orders_chain: Chain = desired_orders_chain
@@ -54,7 +55,7 @@ class MarketMaker:
         try:
             self._logger.debug(f"[{context.name}] Pulse started with oracle price:\n    {model_state.price}")
 
-            payer = mango.CombinableInstructions.from_wallet(self.wallet)
+            payer = self._payer
 
             desired_orders = self.desired_orders_chain.process(context, model_state)
 
@@ -19,6 +19,7 @@ import mango
 import time
 import typing
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
 from solana.publickey import PublicKey
 
@@ -71,6 +72,9 @@ class WebsocketModelStateBuilder(ModelStateBuilder):
 #
 # Base class for building a `ModelState` through polling.
 #
+# Polls fetch the oracle price at the same time as loading the accounts, so a poll takes as long as the
+# slower of the two instead of both one after the other.
+#
 class PollingModelStateBuilder(ModelStateBuilder):
     def __init__(self) -> None:
         super().__init__()
@@ -147,7 +151,10 @@ class SerumPollingModelStateBuilder(PollingModelStateBuilder):
             self.market.bids_address,
             self.market.asks_address
         ]
-        account_infos: typing.Sequence[mango.AccountInfo] = mango.AccountInfo.load_multiple(context, addresses)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            price_future: Future[mango.Price] = executor.submit(self.oracle.fetch_price, context)
+            account_infos: typing.Sequence[mango.AccountInfo] = mango.AccountInfo.load_multiple(context, addresses)
+        price: mango.Price = price_future.result()
         group: mango.Group = mango.Group.parse_with_context(context, account_infos[0])
         cache: mango.Cache = mango.Cache.parse(account_infos[1])
         account: mango.Account = mango.Account.parse(account_infos[2], group, cache)
@@ -162,8 +169,6 @@ class SerumPollingModelStateBuilder(PollingModelStateBuilder):
 
         orderbook: mango.OrderBook = self.market.parse_account_infos_to_orderbook(account_infos[6], account_infos[7])
 
-        price: mango.Price = self.oracle.fetch_price(context)
-
         available: Decimal = (base_inventory_token_account.value.value * price.mid_price) + \
             quote_inventory_token_account.value.value
         available_collateral: InstrumentValue = InstrumentValue(quote_inventory_token_account.value.token, available)
@@ -216,7 +221,10 @@ class SpotPollingModelStateBuilder(PollingModelStateBuilder):
             self.market.asks_address,
             *self.all_open_orders_addresses
         ]
-        account_infos: typing.Sequence[mango.AccountInfo] = mango.AccountInfo.load_multiple(context, addresses)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            price_future: Future[mango.Price] = executor.submit(self.oracle.fetch_price, context)
+            account_infos: typing.Sequence[mango.AccountInfo] = mango.AccountInfo.load_multiple(context, addresses)
+        price: mango.Price = price_future.result()
         group: mango.Group = mango.Group.parse_with_context(context, account_infos[0])
         cache: mango.Cache = mango.Cache.parse(account_infos[1])
         account: mango.Account = mango.Account.parse(account_infos[2], group, cache)
@@ -256,8 +264,6 @@ class SpotPollingModelStateBuilder(PollingModelStateBuilder):
 
         orderbook: mango.OrderBook = self.market.parse_account_infos_to_orderbook(account_infos[3], account_infos[4])
 
-        price: mango.Price = self.oracle.fetch_price(context)
-
         return self.from_values(self.order_owner, self.market, group, account, price, placed_orders_container, inventory, orderbook)
 
     def __str__(self) -> str:
@@ -296,7 +302,10 @@ class PerpPollingModelStateBuilder(PollingModelStateBuilder):
             self.market.underlying_perp_market.bids,
             self.market.underlying_perp_market.asks
         ]
-        account_infos: typing.Sequence[mango.AccountInfo] = mango.AccountInfo.load_multiple(context, addresses)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            price_future: Future[mango.Price] = executor.submit(self.oracle.fetch_price, context)
+            account_infos: typing.Sequence[mango.AccountInfo] = mango.AccountInfo.load_multiple(context, addresses)
+        price: mango.Price = price_future.result()
         group: mango.Group = mango.Group.parse_with_context(context, account_infos[0])
         cache: mango.Cache = mango.Cache.parse(account_infos[1])
         account: mango.Account = mango.Account.parse(account_infos[2], group, cache)
@@ -320,8 +329,6 @@ class PerpPollingModelStateBuilder(PollingModelStateBuilder):
 
         orderbook: mango.OrderBook = self.market.parse_account_infos_to_orderbook(account_infos[3], account_infos[4])
 
-        price: mango.Price = self.oracle.fetch_price(context)
-
         return self.from_values(self.order_owner, self.market, group, account, price, placed_orders_container, inventory, orderbook)
 
     def __str__(self) -> str:
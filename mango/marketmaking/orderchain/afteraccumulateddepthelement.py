@@ -67,7 +67,7 @@ class AfterAccumulatedDepthElement(Element):
         for order in orders:
             new_price: typing.Optional[Decimal] = None
             depth: Decimal = self.depth or order.quantity
-            if order.side == mango.Side.BUY:
+            if order.side is mango.Side.BUY:
                 place_below: typing.Optional[mango.Order] = self._accumulated_quantity_exceeds_order(
                     model_state.bids, model_state.order_owner, depth)
                 if place_below is not None:
@@ -14,6 +14,7 @@
 #   [Email](mailto:hello@blockworks.foundation)
 
 import argparse
+import logging
 import mango
 import typing
 
@@ -32,6 +33,8 @@ class FixedSpreadElement(PairwiseElement):
     def __init__(self, spreads: typing.Sequence[Decimal]) -> None:
         super().__init__()
         self.spreads: typing.Sequence[Decimal] = spreads
+        # Spreads don't change, so each level's half-spread is worked out once here instead of every pulse.
+        self.half_spreads: typing.Sequence[Decimal] = tuple(spread / 2 for spread in spreads)
 
     @staticmethod
     def add_command_line_parameters(parser: argparse.ArgumentParser) -> None:
@@ -48,22 +51,27 @@ class FixedSpreadElement(PairwiseElement):
 
     def process_order_pair(self, context: mango.Context, model_state: ModelState, index: int, buy: typing.Optional[mango.Order], sell: typing.Optional[mango.Order]) -> typing.Tuple[typing.Optional[mango.Order], typing.Optional[mango.Order]]:
         # If no spread is explicitly specified for this element, just use the last specified spread.
-        spread: Decimal = self.spreads[index] if index < len(self.spreads) else self.spreads[-1]
-        half_spread: Decimal = spread / 2
+        level: int = min(index, len(self.spreads) - 1)
+        spread: Decimal = self.spreads[level]
+        half_spread: Decimal = self.half_spreads[level]
         price: mango.Price = model_state.price
         new_buy: typing.Optional[mango.Order] = None
         new_sell: typing.Optional[mango.Order] = None
+        # Formatting the debug messages means formatting both `Order`s, so don't do it unless it'll be logged.
+        debug_enabled: bool = self._logger.isEnabledFor(logging.DEBUG)
         if buy is not None:
             new_buy_price: Decimal = price.mid_price - half_spread
             new_buy = buy.with_price(new_buy_price)
-            self._logger.debug(f"""Order change - using fixed spread of {spread:,.8f} - new BUY price {new_buy_price:,.8f} is {half_spread:,.8f} from mid price {price.mid_price:,.8f}:
+            if debug_enabled:
+                self._logger.debug(f"""Order change - using fixed spread of {spread:,.8f} - new BUY price {new_buy_price:,.8f} is {half_spread:,.8f} from mid price {price.mid_price:,.8f}:
     Old: {buy}
     New: {new_buy}""")
 
         if sell is not None:
             new_sell_price: Decimal = price.mid_price + half_spread
             new_sell = sell.with_price(new_sell_price)
-            self._logger.debug(f"""Order change - using fixed spread of {spread:,.8f} - new SELL price {new_sell_price:,.8f} is {half_spread:,.8f} from mid price {price.mid_price:,.8f}:
+            if debug_enabled:
+                self._logger.debug(f"""Order change - using fixed spread of {spread:,.8f} - new SELL price {new_sell_price:,.8f} is {half_spread:,.8f} from mid price {price.mid_price:,.8f}:
     Old: {sell}
     New: {new_sell}""")
 
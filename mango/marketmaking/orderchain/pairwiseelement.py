@@ -57,14 +57,19 @@ class PairwiseElement(Element, metaclass=abc.ABCMeta):
     # first in the incoming order list.
     #
     # We want to meet that expected approach, so we'll:
-    # * Split the list into BUYs and SELLs
+    # * Split the list into BUYs and SELLs, in a single pass over it
     # * Sort the two lists so closest to top-of-book is at index 0
     # * Call process_order_pair() for each paired BUY and SELL, with the index parameter being
     #   the index into the BUY and SELL lists.
     def process(self, context: mango.Context, model_state: ModelState, orders: typing.Sequence[mango.Order]) -> typing.Sequence[mango.Order]:
-        buys: typing.List[mango.Order] = list([order for order in orders if order.side == mango.Side.BUY])
+        buys: typing.List[mango.Order] = []
+        sells: typing.List[mango.Order] = []
+        for order in orders:
+            if order.side is mango.Side.BUY:
+                buys.append(order)
+            elif order.side is mango.Side.SELL:
+                sells.append(order)
         buys.sort(key=lambda order: order.price, reverse=True)
-        sells: typing.List[mango.Order] = list([order for order in orders if order.side == mango.Side.SELL])
         sells.sort(key=lambda order: order.price)
 
         pair_count: int = max(len(buys), len(sells))
@@ -75,10 +80,10 @@ class PairwiseElement(Element, metaclass=abc.ABCMeta):
 
             (new_buy, new_sell) = self.process_order_pair(context, model_state, index, old_buy, old_sell)
             if new_buy is not None:
-                new_orders += [new_buy]
+                new_orders.append(new_buy)
 
             if new_sell is not None:
-                new_orders += [new_sell]
+                new_orders.append(new_sell)
 
         return new_orders
 
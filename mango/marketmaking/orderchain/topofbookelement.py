@@ -60,7 +60,7 @@ class TopOfBookElement(Element):
         adjustment: Decimal = self.adjustment_ticks * model_state.market.lot_size_converter.tick_size
         for order in orders:
             new_price: typing.Optional[Decimal] = None
-            if order.side == mango.Side.BUY:
+            if order.side is mango.Side.BUY:
                 place_above: typing.Optional[mango.Order] = self._best_order_from_someone_else(
                     model_state.bids, model_state.order_owner)
                 if place_above is not None:
@@ -117,6 +117,12 @@ class MarketOperations(metaclass=abc.ABCMeta):
     def place_order(self, order: Order) -> Order:
         raise NotImplementedError("MarketOperations.place_order() is not implemented on the base type.")
 
+    # Cancels all the `orders_to_cancel` and places `new_order` in the same transaction, so a re-quote
+    # doesn't have to wait for one transaction to land before sending the next.
+    @abc.abstractmethod
+    def replace_orders(self, orders_to_cancel: typing.Sequence[Order], new_order: Order) -> Order:
+        raise NotImplementedError("MarketOperations.replace_orders() is not implemented on the base type.")
+
     @abc.abstractmethod
     def load_orderbook(self) -> OrderBook:
         raise NotImplementedError("MarketOperations.load_orders() is not implemented on the base type.")
@@ -192,6 +198,10 @@ class NullMarketOperations(MarketOperations):
         self._logger.info(f"[Dry Run] Not placing order {order}.")
         return order
 
+    def replace_orders(self, orders_to_cancel: typing.Sequence[Order], new_order: Order) -> Order:
+        self._logger.info(f"[Dry Run] Not cancelling orders {orders_to_cancel} or placing order {new_order}.")
+        return new_order
+
     def load_orderbook(self) -> OrderBook:
         return OrderBook(self.market_name, NullLotSizeConverter(), [], [])
 
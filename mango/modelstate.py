@@ -106,9 +106,10 @@ class ModelState:
         return self.orderbook.spread
 
     def current_orders(self) -> typing.Sequence[Order]:
-        self.orderbook
-        all_orders = [*self.bids, *self.asks]
-        return list([o for o in all_orders if o.owner == self.order_owner])
+        # Takes the latest orderbook once, so bids and asks are guaranteed to come from the same snapshot.
+        orderbook: OrderBook = self.orderbook
+        order_owner: PublicKey = self.order_owner
+        return [o for orders in (orderbook.bids, orderbook.asks) for o in orders if o.owner == order_owner]
 
     def __str__(self) -> str:
         return f"""« ModelState for market '{self.market.symbol}'
@@ -68,7 +68,12 @@ class OracleSource():
 #
 # This class contains all relevant info for a price.
 #
+# A new `Price` is created for every oracle update, and nothing adds attributes to one, so it uses
+# `__slots__` to avoid carrying a `__dict__` around for each of them.
+#
 class Price():
+    __slots__ = ("source", "timestamp", "market", "top_bid", "mid_price", "top_ask", "confidence")
+
     def __init__(self, source: OracleSource, timestamp: datetime, market: Market, top_bid: Decimal, mid_price: Decimal, top_ask: Decimal, confidence: Decimal) -> None:
         self.source: OracleSource = source
         self.timestamp: datetime = timestamp
@@ -137,6 +142,19 @@ class OracleProvider(metaclass=abc.ABCMeta):
     def all_available_symbols(self, context: Context) -> typing.Sequence[str]:
         raise NotImplementedError("OracleProvider.all_available_symbols() is not implemented on the base type.")
 
+    # Streams prices for all the `markets` as one `Observable`. By default this just merges each market's
+    # own `Oracle` stream, but providers that can fetch or subscribe to several markets at once can
+    # override it to use a single connection.
+    def stream_all(self, context: Context, markets: typing.Sequence[Market]) -> rx.core.typing.Observable[Price]:
+        streams: typing.List[rx.core.typing.Observable[Price]] = []
+        for market in markets:
+            oracle = self.oracle_for_market(context, market)
+            if oracle is None:
+                raise Exception(f"Could not find oracle for market {market.symbol} from provider {self.name}.")
+            streams += [oracle.to_streaming_observable(context)]
+
+        return typing.cast(rx.core.typing.Observable[Price], rx.merge(*streams))
+
     def __str__(self) -> str:
         return f"« OracleProvider {self.name} »"
 
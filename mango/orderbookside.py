@@ -104,6 +104,15 @@ class PerpOrderBookSide(AddressableAccount):
         else:
             order_side = Side.SELL
 
+        # These only depend on the market, so there's no need to work them out again for every leaf.
+        decimals_differential = self.perp_market_details.base_instrument.decimals - \
+            self.perp_market_details.quote_token.token.decimals
+        native_to_ui = Decimal(10) ** decimals_differential
+        quote_lot_size = self.perp_market_details.quote_lot_size
+        base_lot_size = self.perp_market_details.base_lot_size
+        lot_size_ratio = quote_lot_size / base_lot_size
+        base_factor = Decimal(10) ** self.perp_market_details.base_instrument.decimals
+
         stack = [self.root_node]
         orders: typing.List[Order] = []
         while len(stack) > 0:
@@ -113,28 +122,21 @@ class PerpOrderBookSide(AddressableAccount):
                 price = node.key["price"]
                 quantity = node.quantity
 
-                decimals_differential = self.perp_market_details.base_instrument.decimals - \
-                    self.perp_market_details.quote_token.token.decimals
-                native_to_ui = Decimal(10) ** decimals_differential
-                quote_lot_size = self.perp_market_details.quote_lot_size
-                base_lot_size = self.perp_market_details.base_lot_size
-                actual_price = price * (quote_lot_size / base_lot_size) * native_to_ui
-
-                base_factor = Decimal(10) ** self.perp_market_details.base_instrument.decimals
-                actual_quantity = (quantity * self.perp_market_details.base_lot_size) / base_factor
-
-                orders += [Order(int(node.key["order_id"]),
-                                 node.client_order_id,
-                                 node.owner,
-                                 order_side,
-                                 actual_price,
-                                 actual_quantity,
-                                 OrderType.UNKNOWN)]
+                actual_price = price * lot_size_ratio * native_to_ui
+                actual_quantity = (quantity * base_lot_size) / base_factor
+
+                orders.append(Order(int(node.key["order_id"]),
+                                    node.client_order_id,
+                                    node.owner,
+                                    order_side,
+                                    actual_price,
+                                    actual_quantity,
+                                    OrderType.UNKNOWN))
             elif node.type_name == "inner":
-                if order_side == Side.BUY:
-                    stack = [*stack, node.children[0], node.children[1]]
+                if order_side is Side.BUY:
+                    stack += [node.children[0], node.children[1]]
                 else:
-                    stack = [*stack, node.children[1], node.children[0]]
+                    stack += [node.children[1], node.children[0]]
         return orders
 
     def __str__(self) -> str:
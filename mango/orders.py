@@ -44,8 +44,10 @@ class Side(enum.Enum):
 
     @staticmethod
     def from_value(value: pyserum.enums.Side) -> "Side":
-        converted: pyserum.enums.Side = pyserum.enums.Side(int(value))
-        return Side.BUY if converted == pyserum.enums.Side.BUY else Side.SELL
+        side: typing.Optional[Side] = _SIDES_BY_SERUM_VALUE.get(int(value))
+        if side is None:
+            raise ValueError(f"{value} is not a valid Side")
+        return side
 
     def to_serum(self) -> pyserum.enums.Side:
         return pyserum.enums.Side.BUY if self == Side.BUY else pyserum.enums.Side.SELL
@@ -57,6 +59,14 @@ class Side(enum.Enum):
         return f"{self}"
 
 
+# Sides are converted from raw values for every placed order in every account, so look them up directly
+# instead of going through the pyserum enum conversion.
+_SIDES_BY_SERUM_VALUE: typing.Dict[int, Side] = {
+    pyserum.enums.Side.BUY.value: Side.BUY,
+    pyserum.enums.Side.SELL.value: Side.SELL
+}
+
+
 # # 🥭 OrderType enum
 #
 # 3 order types are supported: Limit (most common), IOC (immediate or cancel - not placed on the order book
@@ -170,8 +180,11 @@ class Order(typing.NamedTuple):
         return Order(id=self.id, side=self.side, price=self.price, quantity=self.quantity,
                      client_id=client_id, owner=self.owner, order_type=self.order_type)
 
-    # Returns an identical order with the price changed.
+    # Returns an identical order with the price changed. `Order`s are immutable, so if the price is the same
+    # the existing `Order` is returned instead of a copy.
     def with_price(self, price: Decimal) -> "Order":
+        if price == self.price:
+            return self
         return Order(id=self.id, side=self.side, price=price, quantity=self.quantity,
                      client_id=self.client_id, owner=self.owner, order_type=self.order_type)
 
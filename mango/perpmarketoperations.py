@@ -94,23 +94,22 @@ class PerpMarketOperations(MarketOperations):
         self.market_name: str = market_name
         self.context: Context = context
         self.wallet: Wallet = wallet
+        self._signers: CombinableInstructions = CombinableInstructions.from_wallet(wallet)
         self.market_instruction_builder: PerpMarketInstructionBuilder = market_instruction_builder
         self.account: Account = account
         self.perp_market: PerpMarket = perp_market
 
     def cancel_order(self, order: Order, ok_if_missing: bool = False) -> typing.Sequence[str]:
         self._logger.info(f"Cancelling {self.market_name} order {order}.")
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         cancel: CombinableInstructions = self.market_instruction_builder.build_cancel_order_instructions(
             order, ok_if_missing=ok_if_missing)
         accounts_to_crank = self.perp_market.accounts_to_crank(self.context, self.account.address)
         crank = self.market_instruction_builder.build_crank_instructions(accounts_to_crank)
         settle = self.market_instruction_builder.build_settle_instructions()
-        return (signers + cancel + crank + settle).execute(self.context)
+        return (self._signers + cancel + crank + settle).execute(self.context)
 
     def place_order(self, order: Order) -> Order:
         client_id: int = self.context.generate_client_id()
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         order_with_client_id: Order = order.with_client_id(client_id)
         self._logger.info(f"Placing {self.market_name} order {order_with_client_id}.")
         place: CombinableInstructions = self.market_instruction_builder.build_place_order_instructions(
@@ -118,19 +117,34 @@ class PerpMarketOperations(MarketOperations):
         accounts_to_crank = self.perp_market.accounts_to_crank(self.context, self.account.address)
         crank = self.market_instruction_builder.build_crank_instructions(accounts_to_crank)
         settle = self.market_instruction_builder.build_settle_instructions()
-        (signers + place + crank + settle).execute(self.context)
+        (self._signers + place + crank + settle).execute(self.context)
+        return order_with_client_id
+
+    def replace_orders(self, orders_to_cancel: typing.Sequence[Order], new_order: Order) -> Order:
+        client_id: int = self.context.generate_client_id()
+        order_with_client_id: Order = new_order.with_client_id(client_id)
+        self._logger.info(f"Replacing {self.market_name} orders {orders_to_cancel} with {order_with_client_id}.")
+        cancels: CombinableInstructions = CombinableInstructions.empty()
+        # An order can fill between being loaded and this transaction landing. That mustn't stop the new
+        # order from being placed, so cancels are allowed to find their order missing.
+        for order in orders_to_cancel:
+            cancels += self.market_instruction_builder.build_cancel_order_instructions(order, ok_if_missing=True)
+        place: CombinableInstructions = self.market_instruction_builder.build_place_order_instructions(
+            order_with_client_id)
+        accounts_to_crank = self.perp_market.accounts_to_crank(self.context, self.account.address)
+        crank = self.market_instruction_builder.build_crank_instructions(accounts_to_crank)
+        settle = self.market_instruction_builder.build_settle_instructions()
+        (self._signers + cancels + place + crank + settle).execute(self.context)
         return order_with_client_id
 
     def settle(self) -> typing.Sequence[str]:
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         settle = self.market_instruction_builder.build_settle_instructions()
-        return (signers + settle).execute(self.context)
+        return (self._signers + settle).execute(self.context)
 
     def crank(self, limit: Decimal = Decimal(32)) -> typing.Sequence[str]:
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         accounts_to_crank = self.perp_market.accounts_to_crank(self.context, None)
         crank = self.market_instruction_builder.build_crank_instructions(accounts_to_crank, limit)
-        return (signers + crank).execute(self.context)
+        return (self._signers + crank).execute(self.context)
 
     def create_openorders(self) -> PublicKey:
         return SYSTEM_PROGRAM_ADDRESS
@@ -38,14 +38,10 @@ class PlacedOrder(typing.NamedTuple):
     def build_from_open_orders_data(free_slot_bits: Decimal, is_bid_bits: Decimal, order_ids: typing.Sequence[Decimal], client_order_ids: typing.Sequence[Decimal]) -> typing.Sequence["PlacedOrder"]:
         int_free_slot_bits = int(free_slot_bits)
         int_is_bid_bits = int(is_bid_bits)
-        placed_orders: typing.List[PlacedOrder] = []
-        for index in range(len(order_ids)):
-            if not (int_free_slot_bits & (1 << index)):
-                order_id = int(order_ids[index])
-                client_id = int(client_order_ids[index])
-                side = Side.BUY if int_is_bid_bits & (1 << index) else Side.SELL
-                placed_orders += [PlacedOrder(id=order_id, client_id=client_id, side=side)]
-        return placed_orders
+        return [PlacedOrder(id=int(order_ids[index]),
+                            client_id=int(client_order_ids[index]),
+                            side=Side.BUY if int_is_bid_bits & (1 << index) else Side.SELL)
+                for index in range(len(order_ids)) if not (int_free_slot_bits & (1 << index))]
 
     def __repr__(self) -> str:
         return f"{self}"
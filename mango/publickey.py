@@ -41,3 +41,20 @@ def encode_public_key_for_sorting(address: PublicKey) -> typing.List[int]:
         int.from_bytes(raw[16:24], "little"),
         int.from_bytes(raw[24:32], "little")
     ]
+
+
+# # 🥭 distinct_public_keys function
+#
+# Returns the `PublicKey`s with any duplicates removed, keeping the first of each in its original place.
+#
+# `PublicKey`s aren't hashable, so they're compared by their bytes.
+#
+def distinct_public_keys(addresses: typing.Iterable[PublicKey]) -> typing.List[PublicKey]:
+    seen: typing.Set[bytes] = set()
+    distinct: typing.List[PublicKey] = []
+    for address in addresses:
+        raw = bytes(address)
+        if raw not in seen:
+            seen.add(raw)
+            distinct.append(address)
+    return distinct
@@ -13,8 +13,12 @@
 #   [Github](https://github.com/blockworks-foundation)
 #   [Email](mailto:hello@blockworks.foundation)
 
+import threading
+import time
 import typing
+import weakref
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from decimal import Decimal
 from solana.publickey import PublicKey
 
@@ -23,6 +27,7 @@ from .accountinfo import AccountInfo
 from .addressableaccount import AddressableAccount
 from .context import Context
 from .layouts import layouts
+from .publickey import distinct_public_keys
 from .version import Version
 
 
@@ -205,3 +210,54 @@ class UnseenSerumEventChangesTracker:
             self.last_sequence_number = new_sequence_number
 
         return unseen
+
+
+# Event queue contents are reused for this long when building crank instructions for several transactions
+# in a row.
+_UNPROCESSED_EVENTS_TTL_SECONDS: float = 0.5
+
+
+# # 🥭 OpenOrdersToCrankCache class
+#
+# `OpenOrdersToCrankCache` holds the distinct OpenOrders addresses that have unprocessed events in a market's
+# event queue - the addresses a crank instruction needs.
+#
+# Placing or cancelling several orders in a row would otherwise load the event queue again for every one of
+# them. The addresses are reused for a moment instead - cranking with a slightly stale list is harmless, it
+# just might not consume every event.
+#
+# `addresses_in_background()` loads them on a single worker thread, so a caller can build instructions that
+# need their own network calls at the same time. The thread is only started the first time it's needed, and
+# it's shut down when the `OpenOrdersToCrankCache` is garbage collected.
+#
+class OpenOrdersToCrankCache:
+    def __init__(self, load_unprocessed_events: typing.Callable[[], typing.Sequence[SerumEvent]], ttl_seconds: float = _UNPROCESSED_EVENTS_TTL_SECONDS) -> None:
+        self.load_unprocessed_events: typing.Callable[[], typing.Sequence[SerumEvent]] = load_unprocessed_events
+        self.ttl_seconds: float = ttl_seconds
+        self._cached: typing.Optional[typing.Tuple[float, typing.Sequence[PublicKey]]] = None
+        self._executor_lock: threading.Lock = threading.Lock()
+        self._executor: typing.Optional[ThreadPoolExecutor] = None
+
+    def addresses(self) -> typing.Sequence[PublicKey]:
+        now: float = time.monotonic()
+        if self._cached is not None and now - self._cached[0] < self.ttl_seconds:
+            return self._cached[1]
+
+        open_orders_addresses: typing.Sequence[PublicKey] = distinct_public_keys(
+            event.public_key for event in self.load_unprocessed_events())
+        self._cached = (now, open_orders_addresses)
+        return open_orders_addresses
+
+    def addresses_in_background(self) -> "Future[typing.Sequence[PublicKey]]":
+        with self._executor_lock:
+            if self._executor is None:
+                executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="crank-events")
+                weakref.finalize(self, executor.shutdown, wait=False)
+                self._executor = executor
+            return self._executor.submit(self.addresses)
+
+    def __str__(self) -> str:
+        return f"« OpenOrdersToCrankCache [{self.ttl_seconds} seconds] »"
+
+    def __repr__(self) -> str:
+        return f"{self}"
@@ -26,7 +26,7 @@ from .loadedmarket import LoadedMarket
 from .lotsizeconverter import LotSizeConverter, RaisingLotSizeConverter
 from .market import Market, InventorySource
 from .openorders import OpenOrders
-from .orders import Order
+from .orders import Order, OrderBook
 from .serumeventqueue import SerumEvent, SerumEventQueue
 from .token import Token
 
@@ -58,6 +58,19 @@ class SerumMarket(LoadedMarket):
         orderbook: PySerumOrderBook = PySerumOrderBook.from_bytes(self.underlying_serum_market.state, account_info.data)
         return list(map(Order.from_serum_order, orderbook.orders()))
 
+    # Only the orders owned by `open_orders_address` are converted to `Order`s. The rest of the book is
+    # skipped as soon as its owner is known, so there's no `Decimal` work done on other people's orders.
+    def fetch_orders_for_open_orders(self, context: Context, open_orders_address: PublicKey) -> typing.Sequence[Order]:
+        [bids_info, asks_info] = AccountInfo.load_multiple(context, [self.bids_address, self.asks_address])
+        bids = self._parse_account_info_to_orders_for_open_orders(bids_info, open_orders_address)
+        asks = self._parse_account_info_to_orders_for_open_orders(asks_info, open_orders_address)
+        orderbook: OrderBook = OrderBook(self.symbol, self.lot_size_converter, bids, asks)
+        return [*orderbook.bids, *orderbook.asks]
+
+    def _parse_account_info_to_orders_for_open_orders(self, account_info: AccountInfo, open_orders_address: PublicKey) -> typing.Sequence[Order]:
+        orderbook: PySerumOrderBook = PySerumOrderBook.from_bytes(self.underlying_serum_market.state, account_info.data)
+        return [Order.from_serum_order(serum_order) for serum_order in orderbook.orders() if serum_order.open_order_address == open_orders_address]
+
     def unprocessed_events(self, context: Context) -> typing.Sequence[SerumEvent]:
         event_queue: SerumEventQueue = SerumEventQueue.load(context, self.underlying_serum_market.state.event_queue())
         return event_queue.unprocessed_events
@@ -16,6 +16,7 @@
 
 import typing
 
+from concurrent.futures import Future
 from decimal import Decimal
 from pyserum.market.market import Market as PySerumMarket
 from solana.publickey import PublicKey
@@ -27,7 +28,8 @@ from .instructions import build_create_serum_open_orders_instructions, build_ser
 from .marketoperations import MarketInstructionBuilder, MarketOperations
 from .openorders import OpenOrders
 from .orders import Order, OrderBook, Side
-from .publickey import encode_public_key_for_sorting
+from .publickey import distinct_public_keys, encode_public_key_for_sorting
+from .serumeventqueue import OpenOrdersToCrankCache
 from .serummarket import SerumMarket
 from .token import Instrument, Token
 from .tokenaccount import TokenAccount
@@ -125,11 +127,8 @@ class SerumMarketInstructionBuilder(MarketInstructionBuilder):
             self._logger.debug("Returning empty crank instructions - no serum OpenOrders address provided.")
             return CombinableInstructions.empty()
 
-        open_orders_to_crank: typing.Sequence[PublicKey] = [*open_orders_addresses, self.open_orders_address]
-        distinct_open_orders_addresses: typing.List[PublicKey] = []
-        for oo in open_orders_to_crank:
-            if oo not in distinct_open_orders_addresses:
-                distinct_open_orders_addresses += [oo]
+        distinct_open_orders_addresses: typing.List[PublicKey] = distinct_public_keys(
+            [*open_orders_addresses, self.open_orders_address])
 
         limited_open_orders_addresses = distinct_open_orders_addresses[0:min(
             int(limit), len(distinct_open_orders_addresses))]
@@ -160,50 +159,73 @@ class SerumMarketOperations(MarketOperations):
         super().__init__(serum_market)
         self.context: Context = context
         self.wallet: Wallet = wallet
+        self._signers: CombinableInstructions = CombinableInstructions.from_wallet(wallet)
         self.serum_market: SerumMarket = serum_market
         self.market_instruction_builder: SerumMarketInstructionBuilder = market_instruction_builder
+        self._open_orders_to_crank: OpenOrdersToCrankCache = OpenOrdersToCrankCache(
+            lambda: self.serum_market.unprocessed_events(self.context))
 
     def cancel_order(self, order: Order, ok_if_missing: bool = False) -> typing.Sequence[str]:
         self._logger.info(f"Cancelling {self.serum_market.symbol} order {order}.")
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         cancel: CombinableInstructions = self.market_instruction_builder.build_cancel_order_instructions(
             order, ok_if_missing=ok_if_missing)
         crank: CombinableInstructions = self._build_crank()
         settle: CombinableInstructions = self.market_instruction_builder.build_settle_instructions()
-        return (signers + cancel + crank + settle).execute(self.context)
+        return (self._signers + cancel + crank + settle).execute(self.context)
 
     def place_order(self, order: Order) -> Order:
         client_id: int = self.context.generate_client_id()
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         open_orders_address = self.market_instruction_builder.open_orders_address or SYSTEM_PROGRAM_ADDRESS
         order_with_client_id: Order = Order(id=0, client_id=client_id, side=order.side, price=order.price,
                                             quantity=order.quantity, owner=open_orders_address,
                                             order_type=order.order_type)
         self._logger.info(f"Placing {self.serum_market.symbol} order {order_with_client_id}.")
+        # Building the place instructions can go to the network (to create an OpenOrders account), so the
+        # event queue is loaded at the same time.
+        events_future: Future[typing.Sequence[PublicKey]] = self._open_orders_to_crank.addresses_in_background()
         place: CombinableInstructions = self.market_instruction_builder.build_place_order_instructions(
             order_with_client_id)
+        open_orders_to_crank: typing.Sequence[PublicKey] = events_future.result()
 
-        crank: CombinableInstructions = self._build_crank()
+        crank: CombinableInstructions = self._build_crank(open_orders_to_crank=open_orders_to_crank)
         settle: CombinableInstructions = self.market_instruction_builder.build_settle_instructions()
 
-        (signers + place + crank + settle).execute(self.context)
+        (self._signers + place + crank + settle).execute(self.context)
         return order
 
+    def replace_orders(self, orders_to_cancel: typing.Sequence[Order], new_order: Order) -> Order:
+        client_id: int = self.context.generate_client_id()
+        open_orders_address = self.market_instruction_builder.open_orders_address or SYSTEM_PROGRAM_ADDRESS
+        order_with_client_id: Order = Order(id=0, client_id=client_id, side=new_order.side, price=new_order.price,
+                                            quantity=new_order.quantity, owner=open_orders_address,
+                                            order_type=new_order.order_type)
+        self._logger.info(f"Replacing {self.serum_market.symbol} orders {orders_to_cancel} with {order_with_client_id}.")
+        events_future: Future[typing.Sequence[PublicKey]] = self._open_orders_to_crank.addresses_in_background()
+        cancels: CombinableInstructions = CombinableInstructions.empty()
+        for order in orders_to_cancel:
+            cancels += self.market_instruction_builder.build_cancel_order_instructions(order)
+        place: CombinableInstructions = self.market_instruction_builder.build_place_order_instructions(
+            order_with_client_id)
+        open_orders_to_crank: typing.Sequence[PublicKey] = events_future.result()
+
+        crank: CombinableInstructions = self._build_crank(open_orders_to_crank=open_orders_to_crank)
+        settle: CombinableInstructions = self.market_instruction_builder.build_settle_instructions()
+
+        (self._signers + cancels + place + crank + settle).execute(self.context)
+        return order_with_client_id
+
     def settle(self) -> typing.Sequence[str]:
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         settle = self.market_instruction_builder.build_settle_instructions()
-        return (signers + settle).execute(self.context)
+        return (self._signers + settle).execute(self.context)
 
     def crank(self, limit: Decimal = Decimal(32)) -> typing.Sequence[str]:
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         crank = self._build_crank(limit)
-        return (signers + crank).execute(self.context)
+        return (self._signers + crank).execute(self.context)
 
     def create_openorders(self) -> PublicKey:
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         create_open_orders = self.market_instruction_builder.build_create_openorders_instructions()
         open_orders_address = create_open_orders.signers[0].public_key
-        (signers + create_open_orders).execute(self.context)
+        (self._signers + create_open_orders).execute(self.context)
 
         return open_orders_address
 
@@ -220,13 +242,12 @@ class SerumMarketOperations(MarketOperations):
         if not open_orders_address:
             return []
 
-        orderbook: OrderBook = self.load_orderbook()
-        return list([o for o in [*orderbook.bids, *orderbook.asks] if o.owner == open_orders_address])
+        return self.serum_market.fetch_orders_for_open_orders(self.context, open_orders_address)
 
-    def _build_crank(self, limit: Decimal = Decimal(32)) -> CombinableInstructions:
-        open_orders_to_crank: typing.List[PublicKey] = []
-        for event in self.serum_market.unprocessed_events(self.context):
-            open_orders_to_crank += [event.public_key]
+    def _build_crank(self, limit: Decimal = Decimal(32),
+                     open_orders_to_crank: typing.Optional[typing.Sequence[PublicKey]] = None) -> CombinableInstructions:
+        if open_orders_to_crank is None:
+            open_orders_to_crank = self._open_orders_to_crank.addresses()
 
         if len(open_orders_to_crank) == 0:
             return CombinableInstructions.empty()
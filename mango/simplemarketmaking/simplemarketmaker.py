@@ -87,23 +87,19 @@ class SimpleMarketMaker:
                 buy_quantity, sell_quantity = self.calculate_order_quantities(price, inventory)
 
                 current_orders = self.market_operations.load_my_orders()
-                buy_orders = [order for order in current_orders if order.side == mango.Side.BUY]
+                buy_orders = [order for order in current_orders if order.side is mango.Side.BUY]
                 if self.orders_require_action(buy_orders, bid, buy_quantity):
-                    self._logger.info("Cancelling BUY orders.")
-                    for order in buy_orders:
-                        self.market_operations.cancel_order(order)
+                    self._logger.info("Replacing BUY orders.")
                     buy_order: mango.Order = mango.Order.from_basic_info(
                         mango.Side.BUY, bid, buy_quantity, mango.OrderType.POST_ONLY)
-                    self.market_operations.place_order(buy_order)
+                    self.market_operations.replace_orders(buy_orders, buy_order)
 
-                sell_orders = [order for order in current_orders if order.side == mango.Side.SELL]
+                sell_orders = [order for order in current_orders if order.side is mango.Side.SELL]
                 if self.orders_require_action(sell_orders, ask, sell_quantity):
-                    self._logger.info("Cancelling SELL orders.")
-                    for order in sell_orders:
-                        self.market_operations.cancel_order(order)
+                    self._logger.info("Replacing SELL orders.")
                     sell_order: mango.Order = mango.Order.from_basic_info(
                         mango.Side.SELL, ask, sell_quantity, mango.OrderType.POST_ONLY)
-                    self.market_operations.place_order(sell_order)
+                    self.market_operations.replace_orders(sell_orders, sell_order)
 
                 self.update_health_on_successful_iteration()
             except Exception as exception:
@@ -16,6 +16,7 @@
 import logging
 import typing
 
+from concurrent.futures import Future
 from decimal import Decimal
 from pyserum.market.market import Market as PySerumMarket
 from solana.publickey import PublicKey
@@ -28,7 +29,8 @@ from .group import GroupSlot, Group
 from .instructions import build_serum_consume_events_instructions, build_spot_place_order_instructions, build_cancel_spot_order_instructions, build_spot_settle_instructions, build_spot_openorders_instructions
 from .marketoperations import MarketInstructionBuilder, MarketOperations
 from .orders import Order, OrderBook
-from .publickey import encode_public_key_for_sorting
+from .publickey import distinct_public_keys, encode_public_key_for_sorting
+from .serumeventqueue import OpenOrdersToCrankCache
 from .spotmarket import SpotMarket
 from .wallet import Wallet
 
@@ -113,11 +115,8 @@ class SpotMarketInstructionBuilder(MarketInstructionBuilder):
             self._logger.debug("Returning empty crank instructions - no spot OpenOrders address provided.")
             return CombinableInstructions.empty()
 
-        open_orders_to_crank: typing.Sequence[PublicKey] = [*open_orders_addresses, self.open_orders_address]
-        distinct_open_orders_addresses: typing.List[PublicKey] = []
-        for oo in open_orders_to_crank:
-            if oo not in distinct_open_orders_addresses:
-                distinct_open_orders_addresses += [oo]
+        distinct_open_orders_addresses: typing.List[PublicKey] = distinct_public_keys(
+            [*open_orders_addresses, self.open_orders_address])
 
         limited_open_orders_addresses = distinct_open_orders_addresses[0:min(
             int(limit), len(distinct_open_orders_addresses))]
@@ -146,6 +145,7 @@ class SpotMarketOperations(MarketOperations):
         super().__init__(spot_market)
         self.context: Context = context
         self.wallet: Wallet = wallet
+        self._signers: CombinableInstructions = CombinableInstructions.from_wallet(wallet)
         self.group: Group = group
         self.account: Account = account
         self.spot_market: SpotMarket = spot_market
@@ -153,48 +153,71 @@ class SpotMarketOperations(MarketOperations):
 
         self.market_index: int = group.slot_by_spot_market_address(spot_market.address).index
         self.open_orders_address: typing.Optional[PublicKey] = self.account.spot_open_orders_by_index[self.market_index]
+        self._open_orders_to_crank: OpenOrdersToCrankCache = OpenOrdersToCrankCache(
+            lambda: self.spot_market.unprocessed_events(self.context))
 
     def cancel_order(self, order: Order, ok_if_missing: bool = False) -> typing.Sequence[str]:
         self._logger.info(f"Cancelling {self.spot_market.symbol} order {order}.")
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         cancel: CombinableInstructions = self.market_instruction_builder.build_cancel_order_instructions(
             order, ok_if_missing=ok_if_missing)
         crank: CombinableInstructions = self._build_crank(add_self=True)
         settle: CombinableInstructions = self.market_instruction_builder.build_settle_instructions()
 
-        return (signers + cancel + crank + settle).execute(self.context)
+        return (self._signers + cancel + crank + settle).execute(self.context)
 
     def place_order(self, order: Order) -> Order:
         client_id: int = self.context.generate_client_id()
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         order_with_client_id: Order = order.with_client_id(client_id).with_owner(
             self.open_orders_address or SYSTEM_PROGRAM_ADDRESS)
         self._logger.info(f"Placing {self.spot_market.symbol} order {order}.")
+        # Building the place instructions can go to the network (to create an OpenOrders account), so the
+        # event queue is loaded at the same time.
+        events_future: Future[typing.Sequence[PublicKey]] = self._open_orders_to_crank.addresses_in_background()
         place: CombinableInstructions = self.market_instruction_builder.build_place_order_instructions(
             order_with_client_id)
-        crank: CombinableInstructions = self._build_crank(add_self=True)
+        open_orders_to_crank: typing.Sequence[PublicKey] = events_future.result()
+
+        crank: CombinableInstructions = self._build_crank(add_self=True, open_orders_to_crank=open_orders_to_crank)
+        settle: CombinableInstructions = self.market_instruction_builder.build_settle_instructions()
+
+        transaction_ids = (self._signers + place + crank + settle).execute(self.context)
+        self._logger.info(f"Transaction IDs: {transaction_ids}.")
+
+        return order_with_client_id
+
+    def replace_orders(self, orders_to_cancel: typing.Sequence[Order], new_order: Order) -> Order:
+        client_id: int = self.context.generate_client_id()
+        order_with_client_id: Order = new_order.with_client_id(client_id).with_owner(
+            self.open_orders_address or SYSTEM_PROGRAM_ADDRESS)
+        self._logger.info(f"Replacing {self.spot_market.symbol} orders {orders_to_cancel} with {order_with_client_id}.")
+        events_future: Future[typing.Sequence[PublicKey]] = self._open_orders_to_crank.addresses_in_background()
+        cancels: CombinableInstructions = CombinableInstructions.empty()
+        for order in orders_to_cancel:
+            cancels += self.market_instruction_builder.build_cancel_order_instructions(order)
+        place: CombinableInstructions = self.market_instruction_builder.build_place_order_instructions(
+            order_with_client_id)
+        open_orders_to_crank: typing.Sequence[PublicKey] = events_future.result()
+
+        crank: CombinableInstructions = self._build_crank(add_self=True, open_orders_to_crank=open_orders_to_crank)
         settle: CombinableInstructions = self.market_instruction_builder.build_settle_instructions()
 
-        transaction_ids = (signers + place + crank + settle).execute(self.context)
+        transaction_ids = (self._signers + cancels + place + crank + settle).execute(self.context)
         self._logger.info(f"Transaction IDs: {transaction_ids}.")
 
         return order_with_client_id
 
     def settle(self) -> typing.Sequence[str]:
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         settle = self.market_instruction_builder.build_settle_instructions()
-        return (signers + settle).execute(self.context)
+        return (self._signers + settle).execute(self.context)
 
     def crank(self, limit: Decimal = Decimal(32)) -> typing.Sequence[str]:
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         crank = self._build_crank(limit, add_self=False)
-        return (signers + crank).execute(self.context)
+        return (self._signers + crank).execute(self.context)
 
     def create_openorders(self) -> PublicKey:
-        signers: CombinableInstructions = CombinableInstructions.from_wallet(self.wallet)
         create_open_orders: CombinableInstructions = self.market_instruction_builder.build_create_openorders_instructions()
         open_orders_address: PublicKey = create_open_orders.signers[0].public_key
-        (signers + create_open_orders).execute(self.context)
+        (self._signers + create_open_orders).execute(self.context)
 
         # This line is a little nasty. Now that we know we have an OpenOrders account at this address, update
         # the Account so that future uses (like later in this method) have access to it in the right place.
@@ -215,16 +238,15 @@ class SpotMarketOperations(MarketOperations):
         if not self.open_orders_address:
             return []
 
-        orderbook: OrderBook = self.load_orderbook()
-        return list([o for o in [*orderbook.bids, *orderbook.asks] if o.owner == self.open_orders_address])
+        return self.spot_market.fetch_orders_for_open_orders(self.context, self.open_orders_address)
 
-    def _build_crank(self, limit: Decimal = Decimal(32), add_self: bool = False) -> CombinableInstructions:
-        open_orders_to_crank: typing.List[PublicKey] = []
-        for event in self.spot_market.unprocessed_events(self.context):
-            open_orders_to_crank += [event.public_key]
+    def _build_crank(self, limit: Decimal = Decimal(32), add_self: bool = False,
+                     open_orders_to_crank: typing.Optional[typing.Sequence[PublicKey]] = None) -> CombinableInstructions:
+        if open_orders_to_crank is None:
+            open_orders_to_crank = self._open_orders_to_crank.addresses()
 
         if add_self and self.open_orders_address is not None:
-            open_orders_to_crank += [self.open_orders_address]
+            open_orders_to_crank = [*open_orders_to_crank, self.open_orders_address]
 
         if len(open_orders_to_crank) == 0:
             return CombinableInstructions.empty()
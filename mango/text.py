@@ -25,4 +25,4 @@ def indent_collection_as_str(collection: typing.Sequence[typing.Any]) -> str:
 def indent_item_by(item: typing.Any, levels: int = 1) -> str:
     spaces: int = levels * 4
     spacing: str = " " * spaces
-    return f"{item}".replace("\n", f"\n{spacing}")
+    return str(item).replace("\n", f"\n{spacing}")
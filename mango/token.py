@@ -27,19 +27,28 @@ class Instrument:
         self._logger: logging.Logger = logging.getLogger(self.__class__.__name__)
         self.symbol: str = symbol.upper()
         self.name: str = name
-        self.decimals: Decimal = decimals
+        self.decimals = decimals
+
+    # The power of 10 used for shifting values is calculated once, when the decimals are set, instead of
+    # on every call to `shift_to_decimals()` or `shift_to_native()`.
+    @property
+    def decimals(self) -> Decimal:
+        return self._decimals
+
+    @decimals.setter
+    def decimals(self, decimals: Decimal) -> None:
+        self._decimals: Decimal = decimals
+        self._decimals_multiplier: Decimal = Decimal(10 ** decimals)
 
     def round(self, value: Decimal) -> Decimal:
         return round(value, int(self.decimals))
 
     def shift_to_decimals(self, value: Decimal) -> Decimal:
-        divisor = Decimal(10 ** self.decimals)
-        shifted = value / divisor
+        shifted = value / self._decimals_multiplier
         return shifted
 
     def shift_to_native(self, value: Decimal) -> Decimal:
-        multiplier = Decimal(10 ** self.decimals)
-        shifted = value * multiplier
+        shifted = value * self._decimals_multiplier
         return round(shifted, 0)
 
     def symbol_matches(self, symbol: str) -> bool:
@@ -1,4 +1,7 @@
 import pytest
+import threading
+import time
+import typing
 
 from .context import mango
 from .fakes import fake_account_info, fake_seeded_public_key, fake_token_bank, fake_instrument, fake_instrument_value, fake_perp_account, fake_token
@@ -68,6 +71,7 @@ def test_construction() -> None:
     assert actual.msrm_amount == msrm_amount
     assert actual.being_liquidated == being_liquidated
     assert actual.is_bankrupt == is_bankrupt
+    assert repr(actual) == f"« Account [{account_info.address}] »"
 
 
 def test_slot_lookups() -> None:
@@ -214,3 +218,57 @@ def test_slot_lookups() -> None:
     assert actual.slot_by_instrument(fake_instrument("slot3")) == slots[2]
     with pytest.raises(Exception):
         assert actual.slot_by_instrument(fake_instrument())
+
+    # Slots are cached, but updating spot OpenOrders must still be visible.
+    actual.update_spot_open_orders_for_market(4, fake_seeded_public_key("spot openorders 3"))
+    assert actual.slots_by_index[4] == slots[2]
+    assert actual.spot_open_orders_by_index[4] == fake_seeded_public_key("spot openorders 3")
+    assert len(actual.spot_open_orders) == 3
+
+
+def test_compiled_parser_matches_layout() -> None:
+    for directory in ["empty", "1deposit", "account1", "account2", "perp_account_no_spot_openorders"]:
+        account_info = mango.AccountInfo.load_json(f"tests/testdata/{directory}/account.json")
+        assert mango.account._MANGO_ACCOUNT_PARSER.parse(
+            account_info.data) == layouts.MANGO_ACCOUNT.parse(account_info.data)
+
+
+def test_perp_account_loader_is_deferred() -> None:
+    perp_account = fake_perp_account()
+    calls: typing.List[int] = []
+
+    def loader() -> mango.PerpAccount:
+        calls.append(1)
+        return perp_account
+
+    zero_value = Decimal(0)
+    slot = mango.AccountSlot(1, fake_instrument(), fake_token_bank(), fake_token_bank(), zero_value,
+                             fake_instrument_value(zero_value), zero_value, fake_instrument_value(zero_value),
+                             None, None, loader)
+    assert len(calls) == 0
+    assert slot.perp_account == perp_account
+    assert slot.perp_account == perp_account
+    assert len(calls) == 1
+
+
+def test_load_all_for_owners_keeps_order_and_caps_concurrency(monkeypatch: pytest.MonkeyPatch) -> None:
+    lock = threading.Lock()
+    running: typing.List[int] = [0]
+    most_running: typing.List[int] = [0]
+
+    def load_all_for_owner(context: mango.Context, owner: typing.Any, group: typing.Any) -> typing.Sequence[typing.Any]:
+        with lock:
+            running[0] += 1
+            most_running[0] = max(most_running[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return [(owner, group)]
+    monkeypatch.setattr(mango.Account, "load_all_for_owner", load_all_for_owner)
+
+    owners_and_groups = [(f"owner{index}", f"group{index % 3}") for index in range(40)]
+    actual: typing.Sequence[typing.Any] = mango.Account.load_all_for_owners(None, owners_and_groups)  # type: ignore[arg-type]
+
+    assert actual == [[owner_and_group] for owner_and_group in owners_and_groups]
+    assert most_running[0] <= mango.account._MAXIMUM_CONCURRENT_OWNER_LOADS
+    assert mango.Account.load_all_for_owners(None, []) == []  # type: ignore[arg-type]
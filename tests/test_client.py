@@ -1,9 +1,18 @@
+import json
 import pytest
+import requests
+import time
 import typing
 
 from .context import mango
 
+from solana.blockhash import Blockhash
+from solana.keypair import Keypair
+from solana.publickey import PublicKey
+from solana.rpc.commitment import Finalized, Processed
 from solana.rpc.types import RPCMethod, RPCResponse
+from solana.system_program import TransferParams, transfer
+from solana.transaction import Transaction
 
 
 __FAKE_RPC_METHOD = RPCMethod("fake")
@@ -33,6 +42,45 @@ class RaisingRPCCaller(mango.RPCCaller):
         raise mango.TooManyRequestsRateLimitException("Fake", "fake-name", "https://fake")
 
 
+class FakeResponse:
+    def __init__(self, status_code: int = 200, text: str = '{"jsonrpc": "2.0", "id": 1, "result": {}}') -> None:
+        self.status_code: int = status_code
+        self.content: bytes = text.encode("utf-8")
+        self.headers: typing.Dict[str, str] = {}
+        self.ok: bool = status_code < 400
+        self.text_decoded: bool = False
+        self._text: str = text
+
+    @property
+    def text(self) -> str:
+        self.text_decoded = True
+        return self._text
+
+    def raise_for_status(self) -> None:
+        pass
+
+
+class FakeSession:
+    def __init__(self, *responses: FakeResponse) -> None:
+        self.responses: typing.List[FakeResponse] = list(responses) or [FakeResponse()]
+        self.posted: typing.List[typing.Dict[str, typing.Any]] = []
+        self.got: typing.List[str] = []
+
+    def get(self, url: str, **kwargs: typing.Any) -> FakeResponse:
+        self.got.append(url)
+        return FakeResponse()
+
+    def post(self, **kwargs: typing.Any) -> FakeResponse:
+        self.posted.append(kwargs)
+        return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+
+def fake_session_rpc_caller(session: FakeSession) -> mango.RPCCaller:
+    actual = mango.RPCCaller("Fake", "https://localhost", [], mango.SlotHolder(), mango.InstructionReporter())
+    actual._session = session  # type: ignore[assignment]
+    return actual
+
+
 def test_constructor_sets_correct_values() -> None:
     provider = FakeRPCCaller()
     actual = mango.CompoundRPCCaller("fake", [provider])
@@ -156,3 +204,516 @@ def test_all_failing_raises_exception() -> None:
         actual.make_request(__FAKE_RPC_METHOD, "fake")
 
     assert actual.current == provider1
+
+
+def test_rpc_caller_sends_requests_through_session() -> None:
+    session = FakeSession()
+    actual = fake_session_rpc_caller(session)
+
+    actual.make_request(__FAKE_RPC_METHOD, "fake")
+    actual.make_request(__FAKE_RPC_METHOD, "fake")
+
+    assert len(session.posted) == 2
+    assert session.posted[0]["url"] == "https://localhost"
+
+
+class ConfirmingBetterClient(mango.BetterClient):
+    def __init__(self, confirmed: typing.Sequence[str]) -> None:
+        super().__init__(None, "fake", "devnet", Processed, True, "base64", 0,  # type: ignore[arg-type]
+                         mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+        self.confirmed: typing.Sequence[str] = confirmed
+        self.checked: typing.List[str] = []
+
+    def get_signature_statuses(self, signatures: typing.Sequence[str]) -> typing.Sequence[typing.Any]:
+        self.checked.extend(signatures)
+        return [{"confirmationStatus": "confirmed"} if signature in self.confirmed else None for signature in signatures]
+
+
+def test_rpc_caller_requests_have_timeouts() -> None:
+    session = FakeSession()
+    actual = fake_session_rpc_caller(session)
+
+    actual.make_request(__FAKE_RPC_METHOD, "fake")
+
+    assert session.posted[0]["timeout"] is not None
+
+
+def test_timing_out_calls_second_provider() -> None:
+    class TimingOutRPCCaller(FakeRPCCaller):
+        def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+            self.called = True
+            raise requests.exceptions.Timeout("Fake timeout")
+
+    provider1 = TimingOutRPCCaller()
+    provider2 = FakeRPCCaller()
+    actual = mango.CompoundRPCCaller("fake", [provider1, provider2])
+
+    actual.make_request(__FAKE_RPC_METHOD, "fake")
+
+    assert provider1.called
+    assert provider2.called
+    assert actual.current == provider2
+
+
+def test_rpc_caller_encodes_json_rpc_request() -> None:
+    session = FakeSession()
+    actual = fake_session_rpc_caller(session)
+
+    actual.make_request(RPCMethod("getBalance"), "fake-key", {"commitment": "processed"})
+
+    assert session.posted[0]["headers"] == {"Content-Type": "application/json"}
+    assert json.loads(session.posted[0]["data"]) == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "getBalance",
+        "params": ["fake-key", {"commitment": "processed"}]
+    }
+
+
+def test_rpc_caller_parses_response_bytes_without_decoding_text() -> None:
+    response = FakeResponse(text='{"jsonrpc": "2.0", "id": 1, "result": "parsed"}')
+    session = FakeSession(response)
+    actual = fake_session_rpc_caller(session)
+
+    assert actual.make_request(__FAKE_RPC_METHOD, "fake")["result"] == "parsed"
+    assert not response.text_decoded
+
+
+def test_rpc_caller_batch_request_matches_responses_by_id() -> None:
+    session = FakeSession(FakeResponse(text='[{"jsonrpc": "2.0", "id": 2, "result": "second"}, {"jsonrpc": "2.0", "id": 1, "result": "first"}]'))
+    actual = fake_session_rpc_caller(session)
+
+    responses = actual.make_batch_request([(__FAKE_RPC_METHOD, ["a"]), (__FAKE_RPC_METHOD, ["b"])])
+
+    assert len(session.posted) == 1
+    assert [response["result"] for response in responses] == ["first", "second"]
+    posted = json.loads(session.posted[0]["data"])
+    assert [call["params"] for call in posted] == [["a"], ["b"]]
+
+
+def test_rpc_caller_batch_request_splits_large_batches() -> None:
+    session = FakeSession(FakeResponse(text='[{"jsonrpc": "2.0", "id": 1, "result": 1}, {"jsonrpc": "2.0", "id": 2, "result": 2}]'),
+                          FakeResponse(text='[{"jsonrpc": "2.0", "id": 3, "result": 3}]'))
+    actual = fake_session_rpc_caller(session)
+    actual.max_batch_size = 2
+
+    responses = actual.make_batch_request([(__FAKE_RPC_METHOD, [1]), (__FAKE_RPC_METHOD, [2]), (__FAKE_RPC_METHOD, [3])])
+
+    assert len(session.posted) == 2
+    assert [response["result"] for response in responses] == [1, 2, 3]
+
+
+def test_wait_for_confirmation_with_no_transactions_returns_immediately() -> None:
+    actual = ConfirmingBetterClient([])
+
+    assert actual.wait_for_confirmation([]) == []
+    assert actual.checked == []
+
+
+def test_wait_for_confirmation_checks_all_transactions_each_pass() -> None:
+    actual = ConfirmingBetterClient(["tx1", "tx2", "tx3"])
+
+    confirmed = actual.wait_for_confirmation(["tx1", "tx2", "tx3"], max_wait_in_seconds=10)
+
+    assert sorted(confirmed) == ["tx1", "tx2", "tx3"]
+    assert sorted(actual.checked) == ["tx1", "tx2", "tx3"]
+
+
+class FakeCompatibleClient:
+    def __init__(self) -> None:
+        self.blockhash_cache: bool = False
+        self.blockhash_fetches: int = 0
+        self.sent_blockhashes: typing.List[typing.Any] = []
+
+    def get_recent_blockhash(self, commitment: typing.Any) -> typing.Any:
+        self.blockhash_fetches += 1
+        return {"result": {"value": {"blockhash": f"blockhash-{self.blockhash_fetches}"}}}
+
+    # Like solana-py's `Client.send_transaction()`, this ignores the transaction's own `recent_blockhash` and
+    # fetches a fresh one unless `recent_blockhash` is passed in.
+    def send_transaction(self, transaction: Transaction, *signers: typing.Any, opts: typing.Any, recent_blockhash: typing.Any = None) -> typing.Any:
+        if recent_blockhash is None:
+            recent_blockhash = self.get_recent_blockhash(Finalized)["result"]["value"]["blockhash"]
+        transaction.recent_blockhash = recent_blockhash
+        self.sent_blockhashes.append(transaction.recent_blockhash)
+        return {"result": f"signature-{len(self.sent_blockhashes)}"}
+
+    def send_raw_transaction(self, transaction: bytes, opts: typing.Any) -> typing.Any:
+        self.sent_raw: bytes = transaction
+        return {"result": "raw-signature"}
+
+    def get_signature_statuses(self, signatures: typing.Sequence[str]) -> typing.Any:
+        return {"result": {"context": {"slot": 1}}}
+
+
+def _transfer_transaction(lamports: int) -> Transaction:
+    return Transaction().add(transfer(TransferParams(from_pubkey=PublicKey(1), to_pubkey=PublicKey(2), lamports=lamports)))
+
+
+def test_send_transaction_reuses_recent_blockhash() -> None:
+    compatible_client = FakeCompatibleClient()
+    actual = mango.BetterClient(compatible_client, "fake", "devnet", Processed, True, "base64", None,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+
+    actual.send_transaction(_transfer_transaction(1))
+    actual.send_transaction(_transfer_transaction(2))
+    actual.send_transaction(_transfer_transaction(3))
+
+    assert compatible_client.blockhash_fetches == 1
+    assert compatible_client.sent_blockhashes == ["blockhash-1", "blockhash-1", "blockhash-1"]
+
+
+def test_send_transaction_fetches_fresh_blockhash_for_repeated_instructions() -> None:
+    compatible_client = FakeCompatibleClient()
+    actual = mango.BetterClient(compatible_client, "fake", "devnet", Processed, True, "base64", None,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+
+    actual.send_transaction(_transfer_transaction(1))
+    actual.send_transaction(_transfer_transaction(1))
+    actual.send_transaction(_transfer_transaction(2))
+
+    assert compatible_client.sent_blockhashes == ["blockhash-1", "blockhash-2", "blockhash-2"]
+
+
+def test_send_transaction_with_zero_blockhash_cache_duration_fetches_every_time() -> None:
+    compatible_client = FakeCompatibleClient()
+    actual = mango.BetterClient(compatible_client, "fake", "devnet", Processed, True, "base64", 0,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+
+    actual.send_transaction(_transfer_transaction(1))
+    actual.send_transaction(_transfer_transaction(2))
+
+    assert compatible_client.sent_blockhashes == ["blockhash-1", "blockhash-2"]
+    assert actual._blockhash_cache is None
+
+
+def test_minimum_balance_for_rent_exemption_is_cached() -> None:
+    class RentCountingClient:
+        def __init__(self) -> None:
+            self.calls: int = 0
+
+        def get_minimum_balance_for_rent_exemption(self, size: int, commitment: typing.Any) -> typing.Any:
+            self.calls += 1
+            return {"result": size * 10}
+
+    compatible_client = RentCountingClient()
+    actual = mango.BetterClient(compatible_client, "fake", "devnet", Processed, True, "base64", 0,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+
+    assert actual.get_minimum_balance_for_rent_exemption(165) == 1650
+    assert actual.get_minimum_balance_for_rent_exemption(165) == 1650
+    assert compatible_client.calls == 1
+
+    assert actual.get_minimum_balance_for_rent_exemption(82) == 820
+    assert compatible_client.calls == 2
+
+
+def test_wait_for_confirmation_backs_off_between_passes(monkeypatch: pytest.MonkeyPatch) -> None:
+    pauses: typing.List[float] = []
+    monkeypatch.setattr("mango.client.time.sleep", pauses.append)
+
+    class SlowConfirmingBetterClient(ConfirmingBetterClient):
+        def get_signature_statuses(self, signatures: typing.Sequence[str]) -> typing.Sequence[typing.Any]:
+            self.checked.extend(signatures)
+            return [{"confirmationStatus": "confirmed"} if len(self.checked) >= 4 else None for signature in signatures]
+
+    actual = SlowConfirmingBetterClient([])
+
+    assert actual.wait_for_confirmation(["tx1"], max_wait_in_seconds=60) == ["tx1"]
+    assert len(pauses) == 4
+    assert all(earlier < later for earlier, later in zip(pauses, pauses[1:]))
+    assert 0.4 <= pauses[0] <= 0.5
+
+
+def test_rpc_caller_caches_health_checks() -> None:
+    session = FakeSession()
+    actual = fake_session_rpc_caller(session)
+
+    assert actual.is_connected()
+    assert actual.is_connected()
+    assert session.got == ["https://localhost/health"]
+
+
+def test_rpc_caller_pauses_after_repeated_rate_limiting() -> None:
+    session = FakeSession(FakeResponse(status_code=429))
+    actual = fake_session_rpc_caller(session)
+
+    for _ in range(2):
+        with pytest.raises(mango.TooManyRequestsRateLimitException):
+            actual.make_request(__FAKE_RPC_METHOD, "fake")
+    assert len(session.posted) == 2
+
+    # The breaker is now open, so this shouldn't reach the session at all.
+    with pytest.raises(mango.TooManyRequestsRateLimitException):
+        actual.make_request(__FAKE_RPC_METHOD, "fake")
+    assert len(session.posted) == 2
+
+
+def test_transaction_exception_indents_multiline_items() -> None:
+    actual = mango.TransactionException(None, "Failed", 1, "fake", "https://localhost", "sendTransaction",
+                                        "request", "response", ["account1\naccount2"], "error", ["log1", "log2\nlog3"])
+
+    text = str(actual)
+
+    assert "    Accounts:\n        account1\n        account2\n" in text
+    assert "    Errors:\n        error\n" in text
+    assert "    Logs:\n        log1\n        log2\n        log3\n" in text
+
+
+def test_get_account_infos_returns_results_in_order() -> None:
+    class AccountInfoClient:
+        def get_account_info(self, pubkey: typing.Any, commitment: typing.Any, encoding: typing.Any, data_slice: typing.Any) -> typing.Any:
+            return {"result": {"value": f"info-{pubkey}"}}
+
+    actual = mango.BetterClient(AccountInfoClient(), "fake", "devnet", Processed, True, "base64", 0,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+
+    infos = actual.get_account_infos([f"key{index}" for index in range(20)])
+
+    assert [info["value"] for info in infos] == [f"info-key{index}" for index in range(20)]
+    assert actual.get_account_infos([]) == []
+
+
+def test_send_transaction_sends_pre_signed_transaction_as_is() -> None:
+    compatible_client = FakeCompatibleClient()
+    actual = mango.BetterClient(compatible_client, "fake", "devnet", Processed, True, "base64", 0,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+    signer = Keypair()
+    transaction = Transaction().add(transfer(TransferParams(from_pubkey=signer.public_key, to_pubkey=PublicKey(2), lamports=1)))
+    transaction.recent_blockhash = Blockhash(str(PublicKey(3)))
+    transaction.sign(signer)
+
+    assert actual.send_transaction(transaction) == "raw-signature"
+    assert compatible_client.sent_raw == transaction.serialize()
+    assert compatible_client.blockhash_fetches == 0
+    assert compatible_client.sent_blockhashes == []
+
+
+def test_get_account_info_batched_coalesces_into_one_get_multiple_accounts() -> None:
+    class MultipleAccountsClient:
+        def __init__(self) -> None:
+            self.requested: typing.List[typing.Sequence[typing.Any]] = []
+
+        def get_multiple_accounts(self, pubkeys: typing.Sequence[typing.Any], commitment: typing.Any, encoding: typing.Any) -> typing.Any:
+            self.requested.append(pubkeys)
+            return {"result": {"context": {"slot": 7}, "value": [f"info-{pubkey}" for pubkey in pubkeys]}}
+
+    compatible_client = MultipleAccountsClient()
+    actual = mango.BetterClient(compatible_client, "fake", "devnet", Processed, True, "base64", 0,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+
+    futures = [actual.get_account_info_batched(f"key{index}") for index in range(3)]
+    results = [future.result(timeout=5) for future in futures]
+
+    assert compatible_client.requested == [["key0", "key1", "key2"]]
+    assert results == [{"context": {"slot": 7}, "value": f"info-key{index}"} for index in range(3)]
+
+
+def test_compound_rpc_caller_caches_unchanging_responses() -> None:
+    provider = FakeRPCCaller()
+    actual = mango.CompoundRPCCaller("fake", [provider])
+
+    actual.make_request(RPCMethod("getConfirmedTransaction"), "signature1", "json")
+    assert provider.called
+    provider.called = False
+
+    actual.make_request(RPCMethod("getConfirmedTransaction"), "signature1", "json")
+    assert not provider.called
+
+    actual.make_request(RPCMethod("getConfirmedTransaction"), "signature2", "json")
+    assert provider.called
+    provider.called = False
+
+    actual.make_request(RPCMethod("getMinimumBalanceForRentExemption"), 165)
+    provider.called = False
+    actual.make_request(RPCMethod("getMinimumBalanceForRentExemption"), 165)
+    assert provider.called
+    provider.called = False
+
+    actual.make_request(__FAKE_RPC_METHOD, 165)
+    provider.called = False
+    actual.make_request(__FAKE_RPC_METHOD, 165)
+    assert provider.called
+
+
+def test_send_transaction_refreshes_aging_blockhash_in_background() -> None:
+    compatible_client = FakeCompatibleClient()
+    actual = mango.BetterClient(compatible_client, "fake", "devnet", Processed, True, "base64", None,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+
+    actual.send_transaction(_transfer_transaction(1))
+    fetched_at, blockhash = actual._blockhash_cache  # type: ignore[misc]
+    actual._blockhash_cache = (fetched_at - 5, blockhash)
+
+    # The aging blockhash is still used, and a fresh one is fetched without holding up the send.
+    actual.send_transaction(_transfer_transaction(2))
+    for _ in range(100):
+        if compatible_client.blockhash_fetches == 2:
+            break
+        time.sleep(0.01)
+
+    assert compatible_client.sent_blockhashes == ["blockhash-1", "blockhash-1"]
+    assert compatible_client.blockhash_fetches == 2
+
+    actual.send_transaction(_transfer_transaction(3))
+    assert compatible_client.sent_blockhashes[-1] == "blockhash-2"
+
+
+def test_wait_for_confirmation_does_not_count_processed_transactions(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("mango.client.time.sleep", lambda pause: None)
+
+    class ProcessedBetterClient(ConfirmingBetterClient):
+        def get_signature_statuses(self, signatures: typing.Sequence[str]) -> typing.Sequence[typing.Any]:
+            self.checked.extend(signatures)
+            return [{"confirmationStatus": "processed" if signature == "tx2" else "finalized"} for signature in signatures]
+
+    actual = ProcessedBetterClient([])
+
+    assert actual.wait_for_confirmation(["tx1", "tx2"], max_wait_in_seconds=1) == ["tx1"]
+
+
+def test_slow_provider_is_hedged_with_next_provider() -> None:
+    class SlowRPCCaller(FakeRPCCaller):
+        def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+            self.called = True
+            time.sleep(2)
+            return {"jsonrpc": "2.0", "id": 0, "result": "slow"}
+
+    class FastRPCCaller(FakeRPCCaller):
+        def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+            self.called = True
+            return {"jsonrpc": "2.0", "id": 0, "result": "fast"}
+
+    slow = SlowRPCCaller()
+    fast = FastRPCCaller()
+    actual = mango.CompoundRPCCaller("fake", [slow, fast])
+
+    started = time.monotonic()
+    response = actual.make_request(RPCMethod("getAccountInfo"), "fake")
+
+    assert response["result"] == "fast"
+    assert time.monotonic() - started < 1
+    assert actual.current == slow
+
+
+def test_writes_are_not_hedged() -> None:
+    class SlowRPCCaller(FakeRPCCaller):
+        def make_request(self, method: RPCMethod, *params: typing.Any) -> RPCResponse:
+            self.called = True
+            time.sleep(0.3)
+            return {"jsonrpc": "2.0", "id": 0, "result": "slow"}
+
+    slow = SlowRPCCaller()
+    other = FakeRPCCaller()
+    actual = mango.CompoundRPCCaller("fake", [slow, other])
+
+    assert actual.make_request(RPCMethod("sendTransaction"), "fake")["result"] == "slow"
+    assert not other.called
+
+
+def test_failing_hedged_request_moves_to_backup_provider() -> None:
+    failing = RaisingRPCCaller()
+    backup = FakeRPCCaller()
+    actual = mango.CompoundRPCCaller("fake", [failing, backup])
+
+    actual.make_request(RPCMethod("getAccountInfo"), "fake")
+
+    assert failing.called
+    assert backup.called
+    assert actual.current == backup
+
+
+def test_hedging_threads_only_started_when_needed() -> None:
+    actual = mango.CompoundRPCCaller("fake", [FakeRPCCaller(), FakeRPCCaller()])
+    actual.make_request(RPCMethod("sendTransaction"), "fake")
+    assert actual._hedging_executor is None
+
+    actual.make_request(RPCMethod("getAccountInfo"), "fake")
+    assert actual._hedging_executor is not None
+
+    actual.close()
+    assert actual._hedging_executor is None
+
+
+def test_rpc_caller_pauses_for_retry_after() -> None:
+    rate_limited = FakeResponse(status_code=429)
+    rate_limited.headers["Retry-After"] = "30"
+    session = FakeSession(rate_limited)
+    actual = fake_session_rpc_caller(session)
+
+    with pytest.raises(mango.TooManyRequestsRateLimitException) as exception_info:
+        actual.make_request(__FAKE_RPC_METHOD, "fake")
+    assert exception_info.value.retry_after_seconds == 30
+
+    # The node asked for a pause, so this shouldn't reach the session at all.
+    with pytest.raises(mango.TooManyRequestsRateLimitException):
+        actual.make_request(__FAKE_RPC_METHOD, "fake")
+    assert len(session.posted) == 1
+
+
+def test_rpc_caller_throttles_requests(monkeypatch: pytest.MonkeyPatch) -> None:
+    pauses: typing.List[float] = []
+    monkeypatch.setattr("mango.client.time.sleep", pauses.append)
+    session = FakeSession()
+    actual = mango.RPCCaller("Fake", "https://localhost", [], mango.SlotHolder(), mango.InstructionReporter(),
+                             requests_per_second=2)
+    actual._session = session  # type: ignore[assignment]
+
+    for _ in range(3):
+        actual.make_request(__FAKE_RPC_METHOD, "fake")
+
+    # The first two requests are the burst, the third has to wait for a token.
+    assert len(session.posted) == 3
+    assert len(pauses) == 1
+    assert 0.4 < pauses[0] <= 0.5
+
+
+def test_get_multiple_accounts_sends_encoded_keys() -> None:
+    class MultipleAccountsClient:
+        def get_multiple_accounts(self, pubkeys: typing.Sequence[typing.Any], commitment: typing.Any, encoding: typing.Any, data_slice: typing.Any) -> typing.Any:
+            self.requested: typing.Sequence[typing.Any] = pubkeys
+            return {"result": {"value": [None for _ in pubkeys]}}
+
+    compatible_client = MultipleAccountsClient()
+    actual = mango.BetterClient(compatible_client, "fake", "devnet", Processed, True, "base64", 0,  # type: ignore[arg-type]
+                                mango.CompoundRPCCaller("fake", [FakeRPCCaller()]))
+
+    actual.get_multiple_accounts([PublicKey(1), "11111111111111111111111111111112"])
+
+    assert compatible_client.requested == [str(PublicKey(1)), "11111111111111111111111111111112"]
+
+
+def test_rpc_caller_raises_client_exception_for_text_error() -> None:
+    session = FakeSession(FakeResponse(text='{"jsonrpc": "2.0", "id": 1, "error": "Something went wrong"}'))
+    actual = fake_session_rpc_caller(session)
+
+    with pytest.raises(mango.ClientException) as exception_info:
+        actual.make_request(__FAKE_RPC_METHOD, "fake")
+
+    assert not isinstance(exception_info.value, mango.TransactionException)
+    assert "Something went wrong" in exception_info.value.message
+
+
+def test_rpc_caller_raises_node_is_behind_exception() -> None:
+    session = FakeSession(FakeResponse(text='{"jsonrpc": "2.0", "id": 1, "error": {"code": -32005, "message": "Behind", "data": {"numSlotsBehind": 12}}}'))
+    actual = fake_session_rpc_caller(session)
+
+    with pytest.raises(mango.NodeIsBehindException) as exception_info:
+        actual.make_request(__FAKE_RPC_METHOD, "fake")
+
+    assert exception_info.value.slots_behind == 12
+
+
+def test_better_client_closes_provider_sessions() -> None:
+    class ClosingSession(FakeSession):
+        def close(self) -> None:
+            self.closed = True
+
+    sessions = [ClosingSession(), ClosingSession()]
+    providers = [fake_session_rpc_caller(session) for session in sessions]
+
+    with mango.BetterClient(None, "fake", "devnet", Processed, True, "base64", 0,  # type: ignore[arg-type]
+                            mango.CompoundRPCCaller("fake", providers)):
+        pass
+
+    assert all(session.closed for session in sessions)
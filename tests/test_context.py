@@ -1,3 +1,5 @@
+import argparse
+
 from .context import mango
 
 from decimal import Decimal
@@ -31,3 +33,17 @@ def test_new_from_cluster() -> None:
     assert derived.group_name == "devnet.2"
     assert derived.group_address == PublicKey("Ec2enZyoC4nGpEfu2sUNAa2nUGJHWxoUWYSEJ2hNTWTA")
     context_has_default_values(mango.ContextBuilder.default())
+
+
+def test_requests_per_second_from_command_line() -> None:
+    parser = argparse.ArgumentParser()
+    mango.ContextBuilder.add_command_line_parameters(parser)
+    context = mango.ContextBuilder.from_command_line_parameters(parser.parse_args(["--requests-per-second", "5"]))
+
+    assert context.client.requests_per_second == 5
+    assert all(provider._throttle is not None and provider._throttle.rate_per_second == 5
+               for provider in context.client.rpc_caller.all_providers)
+
+    derived = mango.ContextBuilder.from_group_name(context, "mainnet.1")
+    assert derived.client.requests_per_second == 5
+    assert mango.ContextBuilder.default().client.requests_per_second is None
@@ -1,6 +1,15 @@
 from .context import mango
 
+from solana.publickey import PublicKey
+
 
 def test_decode_binary() -> None:
     data = mango.decode_binary(["SGVsbG8gV29ybGQ=", "base64"])  # "Hello World"
     assert len(data) == 11
+
+
+def test_encode_key() -> None:
+    key = PublicKey("11111111111111111111111111111112")
+    assert mango.encode_key(key) == str(key)
+    # Second call comes from the cache but must give the same result.
+    assert mango.encode_key(key) == str(key)
@@ -0,0 +1,104 @@
+from .context import mango
+from .fakes import fake_context, fake_order, fake_seeded_public_key, fake_wallet
+
+import pytest
+import types
+import typing
+
+from decimal import Decimal
+from solana.publickey import PublicKey
+from solana.transaction import TransactionInstruction
+
+
+def _labelled(label: str) -> mango.CombinableInstructions:
+    return mango.CombinableInstructions.from_instruction(TransactionInstruction([], PublicKey(1), label.encode("utf-8")))
+
+
+class FakeMarketInstructionBuilder:
+    def __init__(self) -> None:
+        self.open_orders_address: typing.Optional[PublicKey] = fake_seeded_public_key("open orders")
+        self.cancelled_ok_if_missing: typing.List[bool] = []
+
+    def build_cancel_order_instructions(self, order: mango.Order, ok_if_missing: bool = False) -> mango.CombinableInstructions:
+        self.cancelled_ok_if_missing.append(ok_if_missing)
+        return _labelled(f"cancel-{order.client_id}")
+
+    def build_place_order_instructions(self, order: mango.Order) -> mango.CombinableInstructions:
+        return _labelled(f"place-{order.client_id}")
+
+    def build_crank_instructions(self, addresses: typing.Sequence[PublicKey], limit: Decimal = Decimal(32)) -> mango.CombinableInstructions:
+        return _labelled("crank")
+
+    def build_settle_instructions(self) -> mango.CombinableInstructions:
+        return _labelled("settle")
+
+
+def _record_executions(monkeypatch: pytest.MonkeyPatch) -> typing.List[typing.List[str]]:
+    executed: typing.List[typing.List[str]] = []
+
+    def execute(self: mango.CombinableInstructions, context: mango.Context, *args: typing.Any, **kwargs: typing.Any) -> typing.Sequence[str]:
+        executed.append([instruction.data.decode("utf-8") for instruction in self.instructions])
+        return ["signature"]
+    monkeypatch.setattr(mango.CombinableInstructions, "execute", execute)
+    return executed
+
+
+def _fake_serum_market() -> typing.Any:
+    unprocessed_event = types.SimpleNamespace(public_key=fake_seeded_public_key("other open orders"))
+    return types.SimpleNamespace(symbol="FAKE/USDC", address=fake_seeded_public_key("market"),
+                                 unprocessed_events=lambda context: [unprocessed_event])
+
+
+def _serum_market_operations(builder: FakeMarketInstructionBuilder) -> mango.MarketOperations:
+    return mango.SerumMarketOperations(fake_context(), fake_wallet(), _fake_serum_market(), builder)  # type: ignore[arg-type]
+
+
+def _spot_market_operations(builder: FakeMarketInstructionBuilder) -> mango.MarketOperations:
+    group = types.SimpleNamespace(slot_by_spot_market_address=lambda address: types.SimpleNamespace(index=0))
+    account = types.SimpleNamespace(spot_open_orders_by_index=[builder.open_orders_address])
+    return mango.SpotMarketOperations(fake_context(), fake_wallet(), group, account, _fake_serum_market(), builder)  # type: ignore[arg-type]
+
+
+def _perp_market_operations(builder: FakeMarketInstructionBuilder) -> mango.MarketOperations:
+    account = types.SimpleNamespace(address=fake_seeded_public_key("account"))
+    perp_market = types.SimpleNamespace(accounts_to_crank=lambda context, address: [fake_seeded_public_key("other account")])
+    return mango.PerpMarketOperations("FAKE-PERP", fake_context(), fake_wallet(), builder, account, perp_market)  # type: ignore[arg-type]
+
+
+def _check_replace_orders(monkeypatch: pytest.MonkeyPatch, build_market_operations: typing.Callable[[FakeMarketInstructionBuilder], mango.MarketOperations]) -> None:
+    executed = _record_executions(monkeypatch)
+    actual = build_market_operations(FakeMarketInstructionBuilder())
+
+    placed = actual.replace_orders([fake_order().with_client_id(11), fake_order().with_client_id(12)],
+                                   fake_order(price=Decimal(2)))
+
+    assert placed.client_id != 0
+    assert placed.price == Decimal(2)
+    assert executed == [["cancel-11", "cancel-12", f"place-{placed.client_id}", "crank", "settle"]]
+
+    # With nothing to cancel, it's just a place (with its crank and settle).
+    placed = actual.replace_orders([], fake_order())
+
+    assert executed[1:] == [[f"place-{placed.client_id}", "crank", "settle"]]
+
+
+def test_serum_replace_orders_cancels_and_places_in_one_transaction(monkeypatch: pytest.MonkeyPatch) -> None:
+    _check_replace_orders(monkeypatch, _serum_market_operations)
+
+
+def test_spot_replace_orders_cancels_and_places_in_one_transaction(monkeypatch: pytest.MonkeyPatch) -> None:
+    _check_replace_orders(monkeypatch, _spot_market_operations)
+
+
+def test_perp_replace_orders_cancels_and_places_in_one_transaction(monkeypatch: pytest.MonkeyPatch) -> None:
+    _check_replace_orders(monkeypatch, _perp_market_operations)
+
+
+def test_perp_replace_orders_allows_cancelled_orders_to_be_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    _record_executions(monkeypatch)
+    builder = FakeMarketInstructionBuilder()
+    actual = _perp_market_operations(builder)
+
+    actual.replace_orders([fake_order().with_client_id(11)], fake_order())
+
+    assert builder.cancelled_ok_if_missing == [True]
@@ -14,3 +14,12 @@ def test_constructor() -> None:
     actual = mango.OpenOrders(account_info, mango.Version.V1, program_address, flags, market,
                               owner, Decimal(0), Decimal(0), Decimal(0), Decimal(0), [], Decimal(0))
     assert actual is not None
+
+
+def test_placed_orders_skip_free_slots() -> None:
+    # Slot 1 is free, slot 0 is a bid and slot 2 is an ask.
+    actual = mango.PlacedOrder.build_from_open_orders_data(Decimal(0b010), Decimal(0b001),
+                                                           [Decimal(10), Decimal(11), Decimal(12)],
+                                                           [Decimal(20), Decimal(21), Decimal(22)])
+    assert actual == [mango.PlacedOrder(id=10, client_id=20, side=mango.Side.BUY),
+                      mango.PlacedOrder(id=12, client_id=22, side=mango.Side.SELL)]
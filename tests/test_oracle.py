@@ -0,0 +1,82 @@
+from .context import mango
+from .fakes import fake_account_info, fake_context, fake_loaded_market, fake_price, fake_seeded_public_key, fake_token
+
+import pytest
+import rx
+import rx.operators as ops
+import threading
+import types
+import typing
+
+from decimal import Decimal
+from mango.oracles.pythnetwork.pythnetwork import PythOracle, PythOracleProvider
+from solana.publickey import PublicKey
+
+
+class FakeOracle(mango.Oracle):
+    def __init__(self, market: mango.Market) -> None:
+        super().__init__(f"Fake Oracle for {market.symbol}", market)
+        self.price: mango.Price = fake_price(market=market)
+
+    def fetch_price(self, context: mango.Context) -> mango.Price:
+        return self.price
+
+    def to_streaming_observable(self, context: mango.Context) -> rx.core.typing.Observable[mango.Price]:
+        return typing.cast(rx.core.typing.Observable[mango.Price], rx.of(self.price))
+
+
+class FakeOracleProvider(mango.OracleProvider):
+    def __init__(self) -> None:
+        super().__init__("Fake Oracle Factory")
+
+    def oracle_for_market(self, context: mango.Context, market: mango.Market) -> typing.Optional[mango.Oracle]:
+        return FakeOracle(market)
+
+    def all_available_symbols(self, context: mango.Context) -> typing.Sequence[str]:
+        return []
+
+
+def test_stream_all_merges_each_markets_prices() -> None:
+    first = fake_loaded_market()
+    second = fake_loaded_market()
+
+    received: typing.List[mango.Price] = []
+    FakeOracleProvider().stream_all(fake_context(), [first, second]).subscribe(mango.FunctionObserver(received.append))
+
+    assert [price.market for price in received] == [first, second]
+
+
+def _fake_market(base_symbol: str) -> mango.LoadedMarket:
+    base = fake_token(base_symbol)
+    quote = fake_token("USDC")
+    return mango.LoadedMarket(fake_seeded_public_key("program ID"), fake_seeded_public_key(f"{base_symbol} market"), mango.InventorySource.ACCOUNT, base, quote, mango.LotSizeConverter(base, Decimal(1), quote, Decimal(1)))
+
+
+def test_pyth_stream_all_fetches_all_prices_in_one_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Products are deliberately in a different order from the markets.
+    products = [
+        types.SimpleNamespace(attr={"symbol": "BBB/USD"}, px_acc=PublicKey(12), address=PublicKey(22)),
+        types.SimpleNamespace(attr={"symbol": "AAA/USD"}, px_acc=PublicKey(11), address=PublicKey(21)),
+    ]
+    monkeypatch.setattr(PythOracleProvider, "_fetch_all_pyth_products", lambda self, context, address: products)
+
+    loaded: typing.List[typing.Sequence[PublicKey]] = []
+
+    def load_multiple(context: mango.Context, addresses: typing.Sequence[PublicKey]) -> typing.List[mango.AccountInfo]:
+        loaded.append(addresses)
+        return [fake_account_info(address=address, data=bytes(address)[-1:]) for address in addresses]
+    monkeypatch.setattr(mango.AccountInfo, "load_multiple", load_multiple)
+    monkeypatch.setattr(PythOracle, "_price_from_account_info",
+                        lambda self, account_info: fake_price(market=self.market, price=Decimal(account_info.data[0])))
+
+    first = _fake_market("AAA")
+    second = _fake_market("BBB")
+    received: typing.List[mango.Price] = []
+    completed = threading.Event()
+    PythOracleProvider(fake_context()).stream_all(fake_context(), [first, second]).pipe(
+        ops.take(2)
+    ).subscribe(mango.FunctionObserver(received.append, on_completed=completed.set))
+
+    assert completed.wait(5)
+    assert loaded == [[PublicKey(11), PublicKey(12)]]
+    assert [(price.market, price.mid_price) for price in received] == [(first, Decimal(11)), (second, Decimal(12))]
@@ -5,7 +5,7 @@ from .context import mango
 
 from decimal import Decimal
 
-from .fakes import fake_order_id
+from .fakes import fake_order, fake_order_id
 
 
 def test_order_book_sides_sorted_by_price() -> None:
@@ -47,6 +47,16 @@ def test_orderbook_spread() -> None:
     assert orderBook.spread == _get_order(asks).price - _get_order(bids, -1).price
 
 
+def test_order_with_price() -> None:
+    order = fake_order(price=Decimal(10))
+    assert order.with_price(Decimal(10)) is order
+
+    changed = order.with_price(Decimal(11))
+    assert changed.price == Decimal(11)
+    assert changed.quantity == order.quantity
+    assert order.price == Decimal(10)
+
+
 # ASK is SELL, BID is BUY
 def _construct_order_book_side(askOrBidSide: mango.Side, size: int) -> typing.Sequence[mango.Order]:
     result_orders: typing.List[mango.Order] = []
@@ -0,0 +1,14 @@
+from .context import mango
+
+from solana.publickey import PublicKey
+
+
+def test_distinct_public_keys_keeps_first_of_each_in_order() -> None:
+    first = PublicKey(1)
+    second = PublicKey(2)
+    third = PublicKey(3)
+
+    actual = mango.distinct_public_keys([second, first, PublicKey(2), third, PublicKey(1)])
+
+    assert actual == [second, first, third]
+    assert mango.distinct_public_keys([]) == []
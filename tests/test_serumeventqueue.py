@@ -0,0 +1,60 @@
+import threading
+import typing
+
+from solana.publickey import PublicKey
+
+from .context import mango
+from mango.serumeventqueue import SerumEvent, SerumEventFlags
+
+from decimal import Decimal
+
+
+def _event_for(public_key: PublicKey) -> SerumEvent:
+    flags = SerumEventFlags(mango.Version.V1, True, False, True, False)
+    return SerumEvent(mango.Version.V1, flags, Decimal(0), Decimal(0), Decimal(0), Decimal(0), Decimal(0),
+                      Decimal(0), public_key, Decimal(0))
+
+
+def test_open_orders_to_crank_are_distinct_and_reused() -> None:
+    loads: typing.List[int] = []
+
+    def load() -> typing.Sequence[SerumEvent]:
+        loads.append(1)
+        return [_event_for(PublicKey(1)), _event_for(PublicKey(2)), _event_for(PublicKey(1))]
+
+    actual = mango.OpenOrdersToCrankCache(load, ttl_seconds=60)
+
+    assert actual.addresses() == [PublicKey(1), PublicKey(2)]
+    assert actual.addresses() == [PublicKey(1), PublicKey(2)]
+    assert len(loads) == 1
+
+
+def test_open_orders_to_crank_reloaded_after_ttl() -> None:
+    loads: typing.List[int] = []
+
+    def load() -> typing.Sequence[SerumEvent]:
+        loads.append(1)
+        return []
+
+    actual = mango.OpenOrdersToCrankCache(load, ttl_seconds=0)
+
+    actual.addresses()
+    actual.addresses()
+    assert len(loads) == 2
+
+
+def test_open_orders_to_crank_loaded_in_background_on_one_thread() -> None:
+    thread_names: typing.List[str] = []
+
+    def load() -> typing.Sequence[SerumEvent]:
+        thread_names.append(threading.current_thread().name)
+        return [_event_for(PublicKey(1))]
+
+    actual = mango.OpenOrdersToCrankCache(load, ttl_seconds=0)
+
+    assert actual._executor is None
+    assert actual.addresses_in_background().result() == [PublicKey(1)]
+    assert actual.addresses_in_background().result() == [PublicKey(1)]
+    assert len(thread_names) == 2
+    assert thread_names[0] == thread_names[1]
+    assert thread_names[0] != threading.current_thread().name